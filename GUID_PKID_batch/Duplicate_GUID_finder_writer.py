@@ -26,6 +26,8 @@ Purpose:
 Scope:
   - ACTIVE MAP only (deep traversal of group and nested sublayers).
   - Deduplicate datasets by catalogPath (same FC referenced many times is read once).
+  - TEXT fields with values but no GUIDs in the first TEXT_SAMPLE_ROWS rows are not scanned;
+    each one is warned about and listed in GUID_Skipped (TEXT_SAMPLE_ROWS = 0 scans them all).
 
 Outputs (to project home):
   • GUID_Duplicates_<ts>.csv            → every duplicate occurrence (value seen ≥ 2)
@@ -42,8 +44,10 @@ Safety:
 """
 
 import arcpy, os, csv, re, uuid
+import numpy as np
 from collections import OrderedDict, deque, defaultdict
 from datetime import datetime
+from itertools import islice
 
 # ---------------- Project + paths ----------------
 aprx = arcpy.mp.ArcGISProject("CURRENT")
@@ -62,6 +66,17 @@ CSV_WITHOUT = os.path.join(PROJECT_HOME, f"GUID_Layers_Without_Fields_{TS}.csv")
 CSV_SKIPPED = os.path.join(PROJECT_HOME, f"GUID_Skipped_{TS}.csv")
 CSV_UPDATES = os.path.join(PROJECT_HOME, f"GUID_Updates_{TS}.csv")
 
+# TEXT candidates are sampled on this many leading rows; a field whose sampled non-empty
+# values never canonicalize is dropped from the full scan. Set to 0 to scan every TEXT field.
+TEXT_SAMPLE_ROWS = 256
+
+# Candidate columns are read into NumPy this many rows at a time (by OID range), so wide
+# TEXT columns never sit in memory for a whole large table at once.
+NUMPY_CHUNK_ROWS = 50000
+
+UPDATES_HEADER = ["dataset", "catalogPath", "layers", "OID", "fieldName", "oldValue", "newValue", "status", "why", "rationale"]
+OCC_HEADER = ["Canonical32Hex", "DatasetName", "DatasetPath", "FieldName", "FieldType", "ObjectID", "LayerRefs", "OriginalValue"]
+
 def msg(s): arcpy.AddMessage(s)
 def warn(s): arcpy.AddWarning(s)
 def err(s): arcpy.AddError(s)
@@ -161,20 +176,103 @@ def hyphenate32(c32):
     """Convert 32-hex canonical to 36-char hyphenated."""
     return f"{c32[0:8]}-{c32[8:12]}-{c32[12:16]}-{c32[16:20]}-{c32[20:32]}"
 
-def format_for_field(c32, field_type, original_value):
+def iter_new_guids(used, batch=1024):
+    """
+    Yield (32-hex, hyphenated) pairs for new version-4 GUIDs not already in `used` (updated in place).
+    Random bytes are drawn with one os.urandom call per batch.
+    """
+    while True:
+        buf = os.urandom(16 * batch)
+        for i in range(0, len(buf), 16):
+            u = uuid.UUID(bytes=buf[i:i + 16], version=4)
+            c32 = u.hex
+            if c32 in used:
+                continue
+            used.add(c32)
+            yield c32, str(u)
+
+def format_for_field(c32, field_type, original_value, hyphenated=None):
     """
     Return a string formatted for the field type while honoring original STYLE for TEXT fields.
     - GUID/GlobalID: return 36-char hyphenated string (no braces).
     - TEXT: preserve original style (braces and hyphens).
+    Pass `hyphenated` when the 36-char form is already known to skip re-hyphenation.
     """
+    hyph = hyphenated or hyphenate32(c32)
     if field_type in ("GUID", "GlobalID"):
-        return hyphenate32(c32)
+        return hyph
     style = detect_style(original_value)
-    if style == "HYPHEN":            return hyphenate32(c32)
+    if style == "HYPHEN":            return hyph
     if style == "COMPACT32":         return c32
-    if style == "BRACED_HYPHEN":     return "{" + hyphenate32(c32) + "}"
+    if style == "BRACED_HYPHEN":     return "{" + hyph + "}"
     if style == "BRACED_COMPACT32":  return "{" + c32 + "}"
-    return hyphenate32(c32)
+    return hyph
+
+# Translate tables for the vectorized pre-pass: drop GUID punctuation, or punctuation + hex digits
+_STRIP_GUID_PUNCT = str.maketrans("", "", "{}-")
+_STRIP_GUID_CHARS = str.maketrans("", "", "{}-0123456789abcdef")
+
+def canon32_column(col):
+    """
+    Vectorized canon32 pre-pass over one NumPy string column.
+    Returns (core, mask): lowercase values with braces/hyphens dropped, and a mask of
+    entries that reduce to exactly 32 hex characters.
+    """
+    s = np.char.lower(np.char.strip(col.astype(str)))
+    core = np.char.translate(s, _STRIP_GUID_PUNCT)
+    mask = (np.char.str_len(core) == 32) & (np.char.str_len(np.char.translate(s, _STRIP_GUID_CHARS)) == 0)
+    return core, mask
+
+def iter_guid_occurrences(ds_name, cat_path, lyr_names, field_names, candidates):
+    """
+    Stream GUID occurrences from one dataset.
+    Yields (Canonical32Hex, DatasetName, DatasetPath, FieldName, FieldType, OID, LayerRefs, OriginalValue).
+    GUID/GlobalID columns are canonicalized entirely in NumPy; TEXT columns use NumPy as a
+    pre-filter and confirm the survivors with canon32 (braces/hyphen placement).
+    Only the OID column is read whole; candidate columns come in NUMPY_CHUNK_ROWS slices.
+    """
+    oid_name = field_names[0]
+    all_oids = np.sort(arcpy.da.TableToNumPyArray(cat_path, [oid_name])[oid_name])
+    q = arcpy.AddFieldDelimiters(cat_path, oid_name)
+    nulls = {n: "" for n in field_names[1:]}
+    for start in range(0, len(all_oids), NUMPY_CHUNK_ROWS):
+        lo = int(all_oids[start])
+        hi = int(all_oids[min(start + NUMPY_CHUNK_ROWS, len(all_oids)) - 1])
+        arr = arcpy.da.TableToNumPyArray(cat_path, field_names, where_clause=f"{q} >= {lo} AND {q} <= {hi}",
+                                         null_value=nulls)
+        oids = arr[oid_name]
+        for fname, ftype, flen in candidates:
+            col = arr[fname]
+            core, mask = canon32_column(col)
+            for i in np.flatnonzero(mask):
+                raw = str(col[i])
+                c32 = canon32(raw) if ftype == "String" else str(core[i])
+                if c32 is None:
+                    continue
+                yield (c32, ds_name, cat_path, fname, ftype, int(oids[i]), lyr_names, raw)
+
+def prune_text_candidates(cat_path, oid_field, candidates, sample_rows=TEXT_SAMPLE_ROWS):
+    """
+    Drop TEXT candidates that hold values in the first `sample_rows` rows but no GUIDs.
+    Fields that are empty throughout the sample are kept (no evidence either way).
+    GUID/GlobalID candidates are always kept.
+    """
+    text_idx = [i for i, (_, ftype, __) in enumerate(candidates) if ftype == "String"]
+    if not sample_rows or not text_idx:
+        return candidates
+    seen_value = [False] * len(candidates)
+    seen_guid = [False] * len(candidates)
+    names = [oid_field] + [candidates[i][0] for i in text_idx]
+    with arcpy.da.SearchCursor(cat_path, names) as cur:
+        for row in islice(cur, sample_rows):
+            for pos, i in enumerate(text_idx, start=1):
+                raw = row[pos]
+                if raw is None or not str(raw).strip():
+                    continue
+                seen_value[i] = True
+                if not seen_guid[i] and canon32(raw) is not None:
+                    seen_guid[i] = True
+    return [c for i, c in enumerate(candidates) if c[1] != "String" or seen_guid[i] or not seen_value[i]]
 
 def test_schema_lock(path):
     try:
@@ -194,74 +292,114 @@ def run():
     # Trackers
     with_fields, without_fields, skipped = [], [], []
 
-    # canonical32 -> set of occurrences
+    # Pass 1 tracks canonical GUIDs seen once / more than once and writes every occurrence to CSV_ALL per completed dataset.
+    # Pass 2 re-reads the scanned datasets and keeps only duplicated GUIDs in memory.
     # occurrence tuple: (DatasetName, DatasetPath, FieldName, FieldType, OID, LayerRefs, OriginalValue)
-    guid_occurrences = defaultdict(set)
-
-    # Collect phase
-    for cat_path, meta in datasets.items():
-        d = arcpy.Describe(cat_path)
-        ds_name = getattr(d, "name", os.path.basename(cat_path))
-        ws = meta["workspace"]
-        lyr_names = ";".join(sorted(meta["layer_names"]))
-
-        # Scan is read-only; but some drivers throw if locked
-        if not test_schema_lock(cat_path):
-            skipped.append({"dataset": ds_name, "catalogPath": cat_path, "layers": lyr_names,
-                            "reason": "Schema lock (exclusive edit/in use)"})
-            warn(f"Skipped (lock): {cat_path}")
-            continue
-
-        fields = arcpy.ListFields(cat_path)
-        if not fields:
-            skipped.append({"dataset": ds_name, "catalogPath": cat_path, "layers": lyr_names,
-                            "reason": "No fields returned"})
-            continue
-
-        oid_field = next((f.name for f in fields if f.type == "OID"), None)
-        if not oid_field:
-            skipped.append({"dataset": ds_name, "catalogPath": cat_path, "layers": lyr_names,
-                            "reason": "No ObjectID field"})
-            continue
+    seen_once, seen_twice = set(), set()
+    total_occ = 0
+    scanned = []  # (ds_name, cat_path, lyr_names, field_names, candidates) for pass 2
+
+    # Collect phase (pass 1)
+    with open(CSV_ALL, "w", newline="", encoding="utf-8") as f_all:
+        w_all = csv.writer(f_all)
+        w_all.writerow(OCC_HEADER)
+        for cat_path, meta in datasets.items():
+            d = arcpy.Describe(cat_path)
+            ds_name = getattr(d, "name", os.path.basename(cat_path))
+            ws = meta["workspace"]
+            lyr_names = ";".join(sorted(meta["layer_names"]))
+
+            # Scan is read-only; but some drivers throw if locked
+            if not test_schema_lock(cat_path):
+                skipped.append({"dataset": ds_name, "catalogPath": cat_path, "layers": lyr_names,
+                                "reason": "Schema lock (exclusive edit/in use)"})
+                warn(f"Skipped (lock): {cat_path}")
+                continue
 
-        candidates = []
-        for f in fields:
-            if f.type in ("GUID", "GlobalID"):
-                candidates.append((f.name, f.type, getattr(f, "length", None)))
-            elif f.type == "String":
-                flen = getattr(f, "length", None)
-                if flen is None or flen >= 32:
-                    candidates.append((f.name, f.type, flen))
-
-        if not candidates:
-            without_fields.append({"dataset": ds_name, "catalogPath": cat_path, "layers": lyr_names,
-                                   "workspace": ws, "reason": "No GUID/GlobalID/Text candidates"})
-            continue
+            fields = arcpy.ListFields(cat_path)
+            if not fields:
+                skipped.append({"dataset": ds_name, "catalogPath": cat_path, "layers": lyr_names,
+                                "reason": "No fields returned"})
+                continue
 
-        with_fields.append({"dataset": ds_name, "catalogPath": cat_path, "layers": lyr_names,
-                            "workspace": ws, "fields": ";".join(n for n,_,__ in candidates)})
+            oid_field = next((f.name for f in fields if f.type == "OID"), None)
+            if not oid_field:
+                skipped.append({"dataset": ds_name, "catalogPath": cat_path, "layers": lyr_names,
+                                "reason": "No ObjectID field"})
+                continue
 
-        field_names = [oid_field] + [n for n,_,__ in candidates]
-        try:
-            with arcpy.da.SearchCursor(cat_path, field_names) as cur:
-                for row in cur:
-                    oid = row[0]
-                    for idx, (fname, ftype, flen) in enumerate(candidates, start=1):
-                        raw = row[idx]
-                        c32 = canon32(raw)
-                        if c32 is None:
-                            continue
-                        guid_occurrences[c32].add((ds_name, cat_path, fname, ftype, oid, lyr_names, str(raw)))
-        except Exception as ex:
-            skipped.append({"dataset": ds_name, "catalogPath": cat_path, "layers": lyr_names,
-                            "reason": f"SearchCursor error: {ex}"})
-            continue
+            candidates = []
+            for f in fields:
+                if f.type in ("GUID", "GlobalID"):
+                    candidates.append((f.name, f.type, getattr(f, "length", None)))
+                elif f.type == "String":
+                    flen = getattr(f, "length", None)
+                    if flen is None or flen >= 32:
+                        candidates.append((f.name, f.type, flen))
+
+            if not candidates:
+                without_fields.append({"dataset": ds_name, "catalogPath": cat_path, "layers": lyr_names,
+                                       "workspace": ws, "reason": "No GUID/GlobalID/Text candidates"})
+                continue
 
-    # Compute duplicates on canonical 32-hex
-    duplicates = {g: occ for g, occ in guid_occurrences.items() if len(occ) > 1}
+            try:
+                kept = prune_text_candidates(cat_path, oid_field, candidates)
+            except Exception as ex:
+                warn(f"TEXT sample failed for {cat_path}; scanning all TEXT fields: {ex}")
+                kept = candidates
+            # Pruning is a sampling guess, so every dropped field is reported for review
+            for fname, _, __ in candidates:
+                if all(fname != k[0] for k in kept):
+                    reason = (f"TEXT field '{fname}' not scanned: no GUIDs in first {TEXT_SAMPLE_ROWS} rows "
+                              f"(set TEXT_SAMPLE_ROWS = 0 to scan it)")
+                    skipped.append({"dataset": ds_name, "catalogPath": cat_path, "layers": lyr_names,
+                                    "reason": reason})
+                    warn(f"{cat_path}: {reason}")
+            candidates = kept
+
+            if not candidates:
+                without_fields.append({"dataset": ds_name, "catalogPath": cat_path, "layers": lyr_names,
+                                       "workspace": ws, "reason": f"No GUIDs in first {TEXT_SAMPLE_ROWS} rows of TEXT fields"})
+                continue
 
-    # Build a global set of used canonical GUIDs to avoid generating collisions
-    used_canon = set(guid_occurrences.keys())
+            with_fields.append({"dataset": ds_name, "catalogPath": cat_path, "layers": lyr_names,
+                                "workspace": ws, "fields": ";".join(n for n,_,__ in candidates)})
+
+            field_names = [oid_field] + [n for n,_,__ in candidates]
+            # A dataset's occurrences are counted and written only once its whole scan succeeds,
+            # so a read that fails partway leaves no orphaned keys for pass 2
+            try:
+                ds_occs = list(iter_guid_occurrences(ds_name, cat_path, lyr_names, field_names, candidates))
+            except Exception as ex:
+                skipped.append({"dataset": ds_name, "catalogPath": cat_path, "layers": lyr_names,
+                                "reason": f"Table read error: {ex}"})
+                continue
+            for occ in ds_occs:
+                c32 = occ[0]
+                if c32 in seen_once:
+                    seen_twice.add(c32)
+                else:
+                    seen_once.add(c32)
+            total_occ += len(ds_occs)
+            w_all.writerows(ds_occs)
+            scanned.append((ds_name, cat_path, lyr_names, field_names, candidates))
+
+    # Compute duplicates on canonical 32-hex (pass 2, only when any GUID was seen twice)
+    dupe_keys = seen_twice
+    duplicates = defaultdict(set)
+    raw_pool = {}  # one shared copy per distinct original value across all occurrences
+    if dupe_keys:
+        for ds_name, cat_path, lyr_names, field_names, candidates in scanned:
+            try:
+                for c32, *occ, raw in iter_guid_occurrences(ds_name, cat_path, lyr_names, field_names, candidates):
+                    if c32 in dupe_keys:
+                        duplicates[c32].add((*occ, raw_pool.setdefault(raw, raw)))
+            except Exception as ex:
+                warn(f"Duplicate re-read failed for {cat_path}: {ex}")
+
+    # Every canonical GUID seen plus every GUID issued below must stay unique
+    used_canon = seen_once
+    new_guids = iter_new_guids(used_canon)
 
     # Plan updates respecting priority: TEXT first, then GUID; never change GlobalID
     # Build per-dataset update plan: dataset -> OID -> list[(field_name, new_value, reason)]
@@ -295,51 +433,31 @@ def run():
         # Generate and stage updates for TEXT targets first
         for ds_name, cat_path, fname, ftype, oid, layers, original in targets_text:
             # Generate new non-colliding guid
-            new_c32 = None
-            while True:
-                new_c32_try = uuid.uuid4().hex  # 32-hex lowercase
-                if new_c32_try not in used_canon:
-                    new_c32 = new_c32_try
-                    used_canon.add(new_c32)
-                    break
-            new_value = format_for_field(new_c32, ftype, original)
+            new_c32, new_hyph = next(new_guids)
+            new_value = format_for_field(new_c32, ftype, original, new_hyph)
             reason = f"Duplicate of canonical {c32}; {master_reason}; TEXT field rewritten"
             updates_plan[cat_path][oid].append((fname, new_value, reason))
             updates_plan_meta[cat_path] = {"layers": layers, "name": ds_name}
 
         # Then stage updates for GUID targets
         for ds_name, cat_path, fname, ftype, oid, layers, original in targets_guid:
-            new_c32 = None
-            while True:
-                new_c32_try = uuid.uuid4().hex
-                if new_c32_try not in used_canon:
-                    new_c32 = new_c32_try
-                    used_canon.add(new_c32)
-                    break
-            new_value = format_for_field(new_c32, ftype, original)
+            new_c32, new_hyph = next(new_guids)
+            new_value = format_for_field(new_c32, ftype, original, new_hyph)
             reason = f"Duplicate of canonical {c32}; {master_reason}; GUID field rewritten"
             updates_plan[cat_path][oid].append((fname, new_value, reason))
             updates_plan_meta[cat_path] = {"layers": layers, "name": ds_name}
 
-    # Execute updates per dataset (skip locked), record update results
+    # Execute updates per dataset (skip locked), record update results as UPDATES_HEADER tuples
     updates_rows = []
     for cat_path, oid_changes in updates_plan.items():
+        ds_label = updates_plan_meta[cat_path].get("name","")
+        ds_layers = updates_plan_meta[cat_path].get("layers","")
         # Check write lock
         if not test_schema_lock(cat_path):
             for oid, changes in oid_changes.items():
                 for (fname, new_value, reason) in changes:
-                    updates_rows.append({
-                        "dataset": updates_plan_meta[cat_path].get("name",""),
-                        "catalogPath": cat_path,
-                        "layers": updates_plan_meta[cat_path].get("layers",""),
-                        "OID": oid,
-                        "fieldName": fname,
-                        "oldValue": "<unread during update>",
-                        "newValue": new_value,
-                        "status": "Skipped",
-                        "why": "Schema lock (cannot edit)",
-                        "rationale": reason
-                    })
+                    updates_rows.append((ds_label, cat_path, ds_layers, oid, fname, "<unread during update>",
+                                         new_value, "Skipped", "Schema lock (cannot edit)", reason))
             warn(f"Skipped edits (lock): {cat_path}")
             continue
 
@@ -352,74 +470,52 @@ def run():
         if not oid_field:
             for oid, changes in oid_changes.items():
                 for (fname, new_value, reason) in changes:
-                    updates_rows.append({
-                        "dataset": updates_plan_meta[cat_path].get("name",""),
-                        "catalogPath": cat_path,
-                        "layers": updates_plan_meta[cat_path].get("layers",""),
-                        "OID": oid,
-                        "fieldName": fname,
-                        "oldValue": "<unavailable>",
-                        "newValue": new_value,
-                        "status": "Skipped",
-                        "why": "No ObjectID field",
-                        "rationale": reason
-                    })
+                    updates_rows.append((ds_label, cat_path, ds_layers, oid, fname, "<unavailable>",
+                                         new_value, "Skipped", "No ObjectID field", reason))
             continue
 
         cursor_fields = [oid_field] + all_fields
 
-        # Build quick lookup for OID -> {fieldName: (newValue, reason)}
-        plan_by_oid = {oid: {fn: (nv, rsn) for (fn, nv, rsn) in changes} for oid, changes in oid_changes.items()}
+        # Planned changes are looked up per row, so no cursor row order is assumed
+        field_idx = {fn: i for i, fn in enumerate(all_fields, start=1)}
+        visited = set()
 
         try:
             with arcpy.da.UpdateCursor(cat_path, cursor_fields) as ucur:
                 for row in ucur:
                     oid = row[0]
-                    field_map = plan_by_oid.get(oid)
-                    if not field_map:
+                    changes = oid_changes.get(oid)
+                    if not changes:
                         continue
+                    visited.add(oid)
                     # Record old values and apply new
-                    for idx, fn in enumerate(all_fields, start=1):
-                        if fn in field_map:
-                            old_val = row[idx]
-                            new_val, rationale = field_map[fn]
-                            row[idx] = new_val
-                            updates_rows.append({
-                                "dataset": updates_plan_meta[cat_path].get("name",""),
-                                "catalogPath": cat_path,
-                                "layers": updates_plan_meta[cat_path].get("layers",""),
-                                "OID": oid,
-                                "fieldName": fn,
-                                "oldValue": str(old_val),
-                                "newValue": str(new_val),
-                                "status": "Success",
-                                "why": "Duplicate resolution",
-                                "rationale": rationale
-                            })
+                    for fn, new_val, rationale in changes:
+                        idx = field_idx[fn]
+                        old_val = row[idx]
+                        row[idx] = new_val
+                        updates_rows.append((ds_label, cat_path, ds_layers, oid, fn, str(old_val),
+                                             str(new_val), "Success", "Duplicate resolution", rationale))
                     ucur.updateRow(row)
+            # Planned OIDs the cursor never returned (deleted since the scan) are reported, not dropped
+            for oid, changes in oid_changes.items():
+                if oid in visited:
+                    continue
+                for (fname, new_value, reason) in changes:
+                    updates_rows.append((ds_label, cat_path, ds_layers, oid, fname, "<row not found>",
+                                         new_value, "Failed", "OID not returned by UpdateCursor", reason))
         except Exception as ex:
             # Log failure for all planned changes in this dataset
             for oid, changes in oid_changes.items():
                 for (fname, new_value, reason) in changes:
-                    updates_rows.append({
-                        "dataset": updates_plan_meta[cat_path].get("name",""),
-                        "catalogPath": cat_path,
-                        "layers": updates_plan_meta[cat_path].get("layers",""),
-                        "OID": oid,
-                        "fieldName": fname,
-                        "oldValue": "<unread due to error>",
-                        "newValue": new_value,
-                        "status": "Failed",
-                        "why": f"UpdateCursor error: {ex}",
-                        "rationale": reason
-                    })
+                    updates_rows.append((ds_label, cat_path, ds_layers, oid, fname, "<unread due to error>",
+                                         new_value, "Failed", f"UpdateCursor error: {ex}", reason))
             err(f"Update failed for {cat_path}: {ex}")
 
     # ---------------- Write CSVs ----------------
     # 1) Duplicates
     with open(CSV_DUPES, "w", newline="", encoding="utf-8") as f:
         w = csv.writer(f)
-        w.writerow(["Canonical32Hex", "DatasetName", "DatasetPath", "FieldName", "FieldType", "ObjectID", "LayerRefs", "OriginalValue"])
+        w.writerow(OCC_HEADER)
         if duplicates:
             for c32, occs in sorted(duplicates.items()):
                 for ds_name, cat_path, fname, ftype, oid, layers, original in sorted(occs):
@@ -427,43 +523,33 @@ def run():
         else:
             w.writerow(["No duplicate GUIDs found.", "", "", "", "", "", "", ""])
 
-    # 2) All GUIDs (provenance)
-    with open(CSV_ALL, "w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        w.writerow(["Canonical32Hex", "DatasetName", "DatasetPath", "FieldName", "FieldType", "ObjectID", "LayerRefs", "OriginalValue"])
-        for c32, occs in sorted(guid_occurrences.items()):
-            for ds_name, cat_path, fname, ftype, oid, layers, original in sorted(occs):
-                w.writerow([c32, ds_name, cat_path, fname, ftype, oid, layers, original])
+    # 2) All GUIDs (provenance) were streamed during the collect phase
 
     # 3) Datasets with candidate fields
     with open(CSV_WITH, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=["dataset","catalogPath","workspace","layers","fields"])
-        w.writeheader()
-        w.writerows(with_fields)
+        w = csv.writer(f)
+        w.writerow(["dataset","catalogPath","workspace","layers","fields"])
+        w.writerows((r["dataset"], r["catalogPath"], r["workspace"], r["layers"], r["fields"]) for r in with_fields)
 
     # 4) Datasets without candidate fields
     with open(CSV_WITHOUT, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=["dataset","catalogPath","workspace","layers","reason"])
-        w.writeheader()
-        w.writerows(without_fields)
+        w = csv.writer(f)
+        w.writerow(["dataset","catalogPath","workspace","layers","reason"])
+        w.writerows((r["dataset"], r["catalogPath"], r["workspace"], r["layers"], r["reason"]) for r in without_fields)
 
     # 5) Skipped
     with open(CSV_SKIPPED, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=["dataset","catalogPath","layers","reason"])
-        w.writeheader()
-        w.writerows(skipped)
+        w = csv.writer(f)
+        w.writerow(["dataset","catalogPath","layers","reason"])
+        w.writerows((r["dataset"], r["catalogPath"], r["layers"], r["reason"]) for r in skipped)
 
     # 6) Updates
     with open(CSV_UPDATES, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(
-            f,
-            fieldnames=["dataset","catalogPath","layers","OID","fieldName","oldValue","newValue","status","why","rationale"]
-        )
-        w.writeheader()
+        w = csv.writer(f)
+        w.writerow(UPDATES_HEADER)
         w.writerows(updates_rows)
 
     # ---------------- Summary ----------------
-    total_occ = sum(len(v) for v in guid_occurrences.values())
     msg(f"Datasets scanned: {len(with_fields) + len(without_fields)}")
     msg(f"GUID occurrences discovered: {total_occ}")
     msg(f"Duplicate canonical GUIDs: {len(duplicates)}")
@@ -15,27 +15,32 @@ Purpose:
 
 Scope:
   - Active map only (no other maps).
-  - Deep traversal of GroupLayers and composite layers.
+  - Deep traversal of GroupLayers and nested groups (isGroupLayer).
   - Deduplicates by catalogPath to avoid double edits.
 
 Safety:
   - Non-destructive attribute fill only.
   - Skips schema-locked datasets.
-  - Updates only selected rows.
+  - Updates only rows matching the NULL/placeholder query.
+  - One edit session per workspace; datasets are lock-tested before it opens.
 
 Output:
   - PKID_Update_<timestamp>.csv in the project home.
 =====================================================================================
 """
 
-import arcpy, os, csv, uuid
-from collections import OrderedDict, deque
+import arcpy, os, csv, sqlite3, threading, time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 # ---------------- Configuration ----------------
 TARGET_ALIAS = "Primary Key Identifier"  # case-insensitive alias match
+_TARGET = TARGET_ALIAS.strip().lower()
 PLACEHOLDERS = {"", " ", "TBD", "NULL", "N/A", "NA", "NONE", "UNKNOWN"}  # for TEXT PK fields
 
+# SQL literal list of uppercased placeholders, built once (quotes escaped; includes '' and ' ')
+_UPPER_PLACEHOLDERS = ", ".join(sorted("'" + p.upper().replace("'", "''") + "'" for p in PLACEHOLDERS))
+
 # ---------------- Project + paths ----------------
 aprx = arcpy.mp.ArcGISProject("CURRENT")
 active_map = aprx.activeMap
@@ -53,206 +58,404 @@ def err(s): arcpy.AddError(s)
 
 # ---------------- Traversal: deep groups + composites (ACTIVE MAP ONLY) -----
 def iter_layers_deep(layer_or_map):
-    """Depth-first traversal over the active map, GroupLayers, and composite layers; yields leaf layers."""
-    stack = deque(layer_or_map.listLayers())
+    """
+    Depth-first traversal over the active map and GroupLayers; yields leaf layers with a data source.
+    Basemap, web and raster layers are dropped on cheap attribute checks before any supports() call.
+    """
+    stack = list(layer_or_map.listLayers())
     while stack:
         lyr = stack.pop()
-        # Descend into any layer that can contain children
-        descended = False
+        # Only true group layers are expanded; leaves never pay for a listLayers() probe
+        if getattr(lyr, "isGroupLayer", False):
+            parent = getattr(lyr, "longName", None)
+            # Guard against listLayers() handing back the group itself
+            stack.extend(sub for sub in lyr.listLayers() if getattr(sub, "longName", None) != parent)
+            continue
+        if (getattr(lyr, "isBasemapLayer", False) or getattr(lyr, "isWebLayer", False)
+                or getattr(lyr, "isRasterLayer", False)):
+            continue
         try:
-            subs = lyr.listLayers()
-            if subs:
-                descended = True
-                for sub in subs:
-                    stack.append(sub)
+            if not lyr.supports("DATASOURCE"):
+                continue
         except Exception:
-            pass
-        if descended:
             continue
         yield lyr  # leaf layer
 
+# ---------------- Describe cache --------------------------------------------
+_DESCRIBE_CACHE = {}
+
+def _cache_key(path):
+    return os.path.normcase(os.path.normpath(path))
+
+def _describe(path):
+    """
+    arcpy.Describe memoized by normalized path; raises like arcpy.Describe for missing paths.
+    Results are also stored under their catalogPath so layer sources and catalog paths share one entry.
+    """
+    key = _cache_key(path)
+    d = _DESCRIBE_CACHE.get(key)
+    if d is None:
+        d = arcpy.Describe(path)
+        _DESCRIBE_CACHE[key] = d
+        cat = getattr(d, "catalogPath", None)
+        if cat:
+            _DESCRIBE_CACHE.setdefault(_cache_key(cat), d)
+    return d
+
 def is_concrete_feature_class(path):
     """Accept file/SDE/shapefile feature classes; reject services, joins, or tables."""
-    if not path or not arcpy.Exists(path):
+    if not path:
         return False
     try:
-        d = arcpy.Describe(path)
+        d = _describe(path)
         st = getattr(d, "shapeType", None)
         return st in ("Point", "Polyline", "Polygon", "Multipoint")
     except Exception:
         return False
 
+def edit_workspace(cat, fallback):
+    """Geodatabase root of a catalog path (walks up past feature datasets); `fallback` if none."""
+    p = cat or ""
+    while p and not p.lower().endswith((".gdb", ".sde")):
+        parent = os.path.dirname(p)
+        if parent == p:
+            return fallback
+        p = parent
+    return p or fallback
+
 def collect_unique_datasources_from_active_map():
     """
     Scan the ACTIVE MAP only. Traverse all groups and nested groups. Gather concrete FCs.
-    Returns OrderedDict: catalogPath -> {'workspace':..., 'layer_names':set()}
+    Returns dict (insertion-ordered): catalogPath -> {'workspace':..., 'edit_ws':..., 'layers_str': 'LayerA;LayerB'}
+    `workspace` is Describe.path (the feature dataset when there is one) for the CSV;
+    `edit_ws` is the geodatabase that owns the connection and edit session.
     """
-    collected = OrderedDict()
+    collected = {}
     for lyr in iter_layers_deep(active_map):
         try:
-            if not hasattr(lyr, "supports") or not lyr.supports("DATASOURCE"):
-                continue
             ds = lyr.dataSource
         except Exception:
             continue
         if not is_concrete_feature_class(ds):
             continue
-        d = arcpy.Describe(ds)
+        d = _describe(ds)
         cat = d.catalogPath
-        entry = collected.setdefault(cat, {"workspace": d.path, "layer_names": set()})
+        entry = collected.setdefault(cat, {"workspace": d.path, "edit_ws": edit_workspace(cat, d.path),
+                                           "layer_names": set()})
         entry["layer_names"].add(lyr.name)
+    # Freeze each layer-name set into the sorted string the CSV rows use
+    for entry in collected.values():
+        entry["layers_str"] = ";".join(sorted(entry.pop("layer_names")))
     return collected
 
 # ---------------- Field + selection helpers ---------------------------------
 def find_pk_field_by_alias(dataset_path):
-    """Return (field_name, field_type, field_length) for the field with alias == TARGET_ALIAS (case-insensitive)."""
+    """
+    Return (field_name, field_type, field_length) for the field with alias == TARGET_ALIAS (case-insensitive).
+    Not cached across datasets by field-name layout: two tables with the same field names can carry
+    different aliases, and a fingerprint would cost the same field walk as the scan it replaces.
+    """
     try:
-        for f in arcpy.ListFields(dataset_path):
-            if (f.aliasName or "").strip().lower() == TARGET_ALIAS.strip().lower():
+        # Fields come from the cached Describe; the first alias match wins
+        for f in _describe(dataset_path).fields:
+            a = f.aliasName
+            if a and a.strip().lower() == _TARGET:
                 return f.name, f.type, getattr(f, "length", None)
     except Exception:
         pass
     return None, None, None
 
-def build_missing_query(temp_layer, field_name, field_type):
-    fld = arcpy.AddFieldDelimiters(temp_layer, field_name)
+def build_missing_query(dataset_path, field_name, field_type):
+    fld = arcpy.AddFieldDelimiters(dataset_path, field_name)
     if field_type == "GUID":
         return f"{fld} IS NULL"
     if field_type == "String":
-        uppers = ", ".join(f"'{p.upper()}'" for p in PLACEHOLDERS if p is not None)
-        return f"{fld} IS NULL OR {fld} = '' OR {fld} = ' ' OR UPPER({fld}) IN ({uppers})"
+        return f"{fld} IS NULL OR UPPER({fld}) IN ({_UPPER_PLACEHOLDERS})"
     return None  # unsupported type
 
+def _retry(fn, attempts=3, base_delay=0.5):
+    """Call fn(); on a lock-related error retry with exponential backoff (0.5s, 1s, ...). Other errors raise."""
+    for i in range(attempts):
+        try:
+            return fn()
+        except Exception as ex:
+            if "lock" not in str(ex).lower() or i == attempts - 1:
+                raise
+            time.sleep(base_delay * (2 ** i))
+
 def test_schema_lock(dataset_path):
     try:
         return arcpy.TestSchemaLock(dataset_path)
     except Exception:
         return False
 
-# ---------------- GUID calculators ------------------------------------------
-def calculate_guid_guidfield(temp_layer, field_name):
-    # Prefer Arcade GUID(); fallback to Python for engines that do not support it
+# ---------------- GUID writer ------------------------------------------------
+def _guid36():
+    """Random version-4 GUID as 36-char lowercase hyphenated text, formatted straight from os.urandom."""
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[0:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}"
+
+def populate_guids(dataset_path, field_name, field_type, field_length, where):
+    """
+    Write a new GUID into every row matching `where` with a single UpdateCursor.
+    GUID fields get the braced uppercase form; TEXT fields get the 36-char hyphenated form.
+    Returns (rows_edited, status).
+    """
+    if field_type == "String" and field_length is not None and field_length < 36:
+        return 0, f"Skipped - Text field too short for GUID (len={field_length})"
+    braced = field_type == "GUID"
+    n = 0
+
+    def fill():
+        # Rows filled by an earlier attempt no longer match `where`, so a retry resumes cleanly
+        nonlocal n
+        with arcpy.da.UpdateCursor(dataset_path, [field_name], where_clause=where) as cur:
+            for row in cur:
+                g = _guid36()
+                row[0] = "{" + g.upper() + "}" if braced else g
+                cur.updateRow(row)
+                n += 1
+
     try:
-        arcpy.management.CalculateField(temp_layer, field_name, "GUID()", "ARCADE")
-        return "Success - GUIDs calculated (Arcade GUID())"
-    except Exception as ex_arcade:
-        try:
-            arcpy.management.CalculateField(
-                temp_layer, field_name, "make_guid()", "PYTHON3",
-                code_block="import uuid\ndef make_guid():\n    return str(uuid.uuid4())"
-            )
-            return "Success - GUIDs calculated (Python fallback)"
-        except Exception as ex_py:
-            return f"Failed - CalculateField error (Arcade: {ex_arcade}; Python: {ex_py})"
-
-def calculate_guid_textfield(temp_layer, field_name, field_length):
-    if field_length is not None and field_length < 36:
-        return f"Skipped - Text field too short for GUID (len={field_length})"
+        _retry(fill)
+    except Exception as ex:
+        return n, f"Failed - UpdateCursor error after {n} rows: {ex}"
+    return n, "Success - GUIDs calculated (UpdateCursor)"
+
+# ---------------- Per-dataset work -----------------------------------------
+def has_missing_rows(dataset_path, where):
+    """Read-only probe: True when at least one row matches `where` (stops at the first OID)."""
+    with arcpy.da.SearchCursor(dataset_path, ["OID@"], where_clause=where) as cur:
+        return next(iter(cur), None) is not None
+
+def plan_dataset(cat_path, meta, ref=None):
+    """
+    Resolve the PK field by alias and probe for missing values without editing.
+    `ref` is the path handed to cursors (defaults to cat_path; relative to arcpy.env.workspace).
+    Returns (row, where): `where` is None when `row` is already final (nothing to edit).
+    """
+    ref = ref or cat_path
+    d = _describe(cat_path)
+    ds_name = getattr(d, "name", os.path.basename(cat_path))
+    ws = meta["workspace"]
+    lyr_names = meta["layers_str"]
+
+    # Resolve PK field by alias
+    pk_name, pk_type, pk_len = find_pk_field_by_alias(cat_path)
+    if not pk_name:
+        return {
+            "dataset": ds_name, "catalogPath": cat_path, "workspace": ws, "layers": lyr_names,
+            "fieldName": "", "fieldType": "", "fieldLength": "", "editsMade": 0,
+            "status": "Skipped", "reason": f"Alias '{TARGET_ALIAS}' not found"
+        }, None
+
+    row = {
+        "dataset": ds_name, "catalogPath": cat_path, "workspace": ws, "layers": lyr_names,
+        "fieldName": pk_name, "fieldType": pk_type, "fieldLength": pk_len or "",
+        "editsMade": 0, "status": "Skipped", "reason": ""
+    }
+    where = build_missing_query(ref, pk_name, pk_type)
+    if not where:
+        row["reason"] = f"Unsupported field type: {pk_type}"
+        return row, None
+    if pk_type == "String" and pk_len is not None and pk_len < 36:
+        row["reason"] = f"Skipped - Text field too short for GUID (len={pk_len})"
+        return row, None
+
+    # Cheap where_clause probe so datasets with nothing to fill never enter an edit session
     try:
-        arcpy.management.CalculateField(
-            temp_layer, field_name, "make_guid()", "PYTHON3",
-            code_block="import uuid\ndef make_guid():\n    return str(uuid.uuid4())"
-        )
-        return "Success - GUIDs calculated (Python)"
+        if not has_missing_rows(ref, where):
+            row["reason"] = "No NULL or placeholder values"
+            return row, None
     except Exception as ex:
-        return f"Failed - CalculateField error: {ex}"
+        row["reason"] = f"Failed - SearchCursor error: {ex}"
+        return row, None
+    return row, where
 
-# ---------------- Main ------------------------------------------------------
-def run():
-    datasets = collect_unique_datasources_from_active_map()
-    if not datasets:
-        msg("Active map contains no eligible feature classes.")
+def apply_plan(ref, row, where):
+    """Populate GUIDs for a planned dataset (path or env-relative name) and complete its CSV row."""
+    count, status = populate_guids(ref, row["fieldName"], row["fieldType"], row["fieldLength"] or None, where)
+    if count <= 0 and status.startswith("Success"):
+        status = "No NULL or placeholder values"
+    row["editsMade"] = count
+    row["status"] = "Success" if status.startswith("Success") else "Skipped"
+    row["reason"] = status
+    return row
+
+# ---------------- Per-workspace work ----------------------------------------
+_SQLITE_EXTS = (".gpkg", ".sqlite")
+
+def _sqlite_wal_begin(ws):
+    """
+    Switch a GeoPackage/SQLite workspace to WAL so readers and the writer do not block each other.
+    Returns the previous journal mode to restore, or None when the workspace is not SQLite-backed.
+    """
+    if not ws.lower().endswith(_SQLITE_EXTS) or not os.path.isfile(ws):
+        return None
+    try:
+        con = sqlite3.connect(ws)
+        try:
+            prev = con.execute("PRAGMA journal_mode").fetchone()[0]
+            if prev.lower() != "wal":
+                con.execute("PRAGMA journal_mode=WAL")
+            return prev
+        finally:
+            con.close()
+    except sqlite3.Error as ex:
+        warn(f"Could not enable WAL on {ws}: {ex}")
+        return None
+
+def _sqlite_wal_end(ws, prev_mode):
+    """Restore the journal mode recorded by _sqlite_wal_begin (WAL persists in the file otherwise)."""
+    if not prev_mode or prev_mode.lower() == "wal":
         return
+    try:
+        con = sqlite3.connect(ws)
+        try:
+            con.execute(f"PRAGMA journal_mode={prev_mode}")
+        finally:
+            con.close()
+    except sqlite3.Error as ex:
+        warn(f"Could not restore journal_mode={prev_mode} on {ws}: {ex}")
 
-    rows = []
-    msg(f"Eligible datasets in active map: {len(datasets)}")
+def process_workspace(ws, items, emit, set_env=False):
+    """
+    Lock-gate, plan and edit every dataset of one workspace; rows go to `emit` as they finish.
+    `ws` is the geodatabase root. With `set_env`, arcpy.env.workspace points at it for the group
+    and cursors/tools get the path relative to it (feature dataset included). arcpy.env is
+    process-wide, so only the single-worker path uses it.
+    """
+    prev_ws = arcpy.env.workspace
+    if set_env:
+        arcpy.env.workspace = ws
+    prev_journal = _sqlite_wal_begin(ws)
+    try:
+        _process_workspace(ws, items, emit, set_env)
+    finally:
+        _sqlite_wal_end(ws, prev_journal)
+        if set_env:
+            arcpy.env.workspace = prev_ws
 
-    for cat_path, meta in datasets.items():
-        d = arcpy.Describe(cat_path)
-        ds_name = getattr(d, "name", os.path.basename(cat_path))
-        ws = meta["workspace"]
-        lyr_names = ";".join(sorted(meta["layer_names"]))
-
-        # Schema-lock gate
-        if not test_schema_lock(cat_path):
-            rows.append({
-                "dataset": ds_name, "catalogPath": cat_path, "workspace": ws, "layers": lyr_names,
+def _process_workspace(ws, items, emit, set_env):
+    # Schema-lock gate and read-only planning (before our own edit session holds the workspace)
+    pending = []
+    for cat_path, meta in items:
+        ref = os.path.relpath(cat_path, ws) if set_env else cat_path
+        if not test_schema_lock(ref):
+            d = _describe(cat_path)
+            emit({
+                "dataset": getattr(d, "name", os.path.basename(cat_path)), "catalogPath": cat_path,
+                "workspace": meta["workspace"], "layers": meta["layers_str"],
                 "fieldName": "", "fieldType": "", "fieldLength": "", "editsMade": 0,
                 "status": "Skipped", "reason": "Schema lock (in edit or in use)"
             })
             warn(f"Skipped (lock): {cat_path}")
             continue
+        row, where = plan_dataset(cat_path, meta, ref)
+        if where is None:
+            emit(row)
+        else:
+            pending.append((ref, row, where))
+    if not pending:
+        return
 
-        # Resolve PK field by alias
-        pk_name, pk_type, pk_len = find_pk_field_by_alias(cat_path)
-        if not pk_name:
-            rows.append({
-                "dataset": ds_name, "catalogPath": cat_path, "workspace": ws, "layers": lyr_names,
-                "fieldName": "", "fieldType": "", "fieldLength": "", "editsMade": 0,
-                "status": "Skipped", "reason": f"Alias '{TARGET_ALIAS}' not found"
-            })
-            continue
-
-        # Temp feature layer and selection
-        tmp_lyr = arcpy.management.MakeFeatureLayer(cat_path, f"lyr_pkid_{uuid.uuid4().hex[:8]}").getOutput(0)
-        where = build_missing_query(tmp_lyr, pk_name, pk_type)
-        if not where:
-            rows.append({
-                "dataset": ds_name, "catalogPath": cat_path, "workspace": ws, "layers": lyr_names,
-                "fieldName": pk_name, "fieldType": pk_type, "fieldLength": pk_len or "",
-                "editsMade": 0, "status": "Skipped", "reason": f"Unsupported field type: {pk_type}"
-            })
-            try: arcpy.management.Delete(tmp_lyr)
-            except Exception: pass
-            continue
+    # Versioned data needs a multiuser session; non-versioned enterprise data must not use one
+    multiuser = any(getattr(_describe(row["catalogPath"]), "isVersioned", False) for _, row, _ in pending)
+    try:
+        editor = arcpy.da.Editor(ws)
+        _retry(lambda: editor.startEditing(False, multiuser))
+        editor.startOperation()
+    except Exception as ex:
+        warn(f"Edit session unavailable for {ws}; editing datasets individually: {ex}")
+        editor = None
+    if editor is None:
+        for ref, row, where in pending:
+            emit(apply_plan(ref, row, where))
+        return
 
-        arcpy.management.SelectLayerByAttribute(tmp_lyr, "NEW_SELECTION", where)
+    # Inside the session rows are held back until the save succeeds: an abort discards every
+    # dataset's edits, and the CSV must not report those as saved
+    done = []
+    abort_reason = None
+    try:
+        for ref, row, where in pending:
+            row = apply_plan(ref, row, where)
+            done.append(row)
+            if row["status"] != "Success" and row["editsMade"]:
+                abort_reason = f"partial fill in {row['dataset']}"
+                break
+    except Exception as ex:
+        abort_reason = f"{type(ex).__name__}: {ex}"
+        raise
+    finally:
+        ok = abort_reason is None
         try:
-            count = int(arcpy.management.GetCount(tmp_lyr).getOutput(0))
-        except Exception:
-            count = 0
+            editor.stopOperation() if ok else editor.abortOperation()
+            editor.stopEditing(ok)
+        except Exception as ex:
+            ok, abort_reason = False, f"stopEditing failed: {ex}"
+        if not ok:
+            warn(f"Edit session aborted for {ws}: {abort_reason}")
+        # Datasets never reached after a break are reported alongside the ones discarded
+        for row in done + [row for _, row, _ in pending[len(done):]]:
+            if not ok:
+                row["editsMade"] = 0
+                row["status"] = "Skipped"
+                row["reason"] = f"Edit session aborted ({abort_reason})" + (f"; {row['reason']}" if row["reason"] else "")
+            emit(row)
 
-        if count <= 0:
-            rows.append({
-                "dataset": ds_name, "catalogPath": cat_path, "workspace": ws, "layers": lyr_names,
-                "fieldName": pk_name, "fieldType": pk_type, "fieldLength": pk_len or "",
-                "editsMade": 0, "status": "Skipped", "reason": "No NULL or placeholder values"
-            })
-            try:
-                arcpy.management.SelectLayerByAttribute(tmp_lyr, "CLEAR_SELECTION")
-                arcpy.management.Delete(tmp_lyr)
-            except Exception:
-                pass
-            continue
+# ---------------- Main ------------------------------------------------------
+CSV_FIELDS = ["dataset","catalogPath","workspace","layers","fieldName","fieldType",
+              "fieldLength","editsMade","status","reason"]
+CSV_FLUSH_EVERY = 50  # rows between explicit flushes so partial progress survives a crash
+MAX_WORKERS = 4       # workspaces processed concurrently (one worker per workspace); 1 = sequential
 
-        # Calculate GUIDs
-        if pk_type == "GUID":
-            status = calculate_guid_guidfield(tmp_lyr, pk_name)
-        elif pk_type == "String":
-            status = calculate_guid_textfield(tmp_lyr, pk_name, pk_len)
-        else:
-            status = f"Skipped - Unsupported field type: {pk_type}"
+def run():
+    datasets = collect_unique_datasources_from_active_map()
+    if not datasets:
+        msg("Active map contains no eligible feature classes.")
+        return
 
-        rows.append({
-            "dataset": ds_name, "catalogPath": cat_path, "workspace": ws, "layers": lyr_names,
-            "fieldName": pk_name, "fieldType": pk_type, "fieldLength": pk_len or "",
-            "editsMade": count, "status": "Success" if status.startswith("Success") else "Skipped",
-            "reason": status
-        })
+    msg(f"Eligible datasets in active map: {len(datasets)}")
 
-        # Cleanup
-        try:
-            arcpy.management.SelectLayerByAttribute(tmp_lyr, "CLEAR_SELECTION")
-            arcpy.management.Delete(tmp_lyr)
-        except Exception:
-            pass
+    # Group by geodatabase so each one opens at most one edit session for all of its datasets,
+    # including those in different feature datasets, and is never touched by two threads
+    groups = {}
+    for cat_path, meta in datasets.items():
+        groups.setdefault(meta["edit_ws"], []).append((cat_path, meta))
+
+    # Summary rows are streamed to CSV as each dataset finishes; the writer is shared across workers
+    f = open(CSV_PATH, "w", newline="", encoding="utf-8", buffering=1 << 20)
+    try:
+        w = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        w.writeheader()
+        lock = threading.Lock()
+        written = 0
+
+        def emit(row):
+            nonlocal written
+            with lock:
+                w.writerow(row)
+                written += 1
+                if written % CSV_FLUSH_EVERY == 0:
+                    f.flush()
+
+        # Distinct workspaces run in parallel; datasets within one workspace stay sequential
+        workers = max(1, min(MAX_WORKERS, len(groups)))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            futures = {ex.submit(process_workspace, ws, items, emit, workers == 1): ws
+                       for ws, items in groups.items()}
+            for fut in as_completed(futures):
+                try:
+                    fut.result()
+                except Exception as e:
+                    err(f"Workspace failed: {futures[fut]}: {e}")
+    finally:
+        f.close()
 
-    # ---------------- Write CSV summary ----------------
-    fields = ["dataset","catalogPath","workspace","layers","fieldName","fieldType",
-              "fieldLength","editsMade","status","reason"]
-    with open(CSV_PATH, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fields)
-        w.writeheader(); w.writerows(rows)
     msg(f"GUID assignment complete. Summary CSV: {CSV_PATH}")
 
 if __name__ == "__main__":
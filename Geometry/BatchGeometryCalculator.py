@@ -32,14 +32,22 @@ Outputs (project home):
 ===================================================================================
 """
 
-import arcpy, logging, os, csv
+import arcpy, logging, os, re, csv, threading, time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from collections import deque
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import lru_cache
 
 # =================== CONFIG ===================
 
 ACTIVE_MAP_ONLY   = False     # True = only active map; False = all maps in the project
 CREATE_MESSAGES   = True      # Emit GP messages
+# Workspaces processed concurrently (layers in one GDB stay sequential); 1 = sequential.
+# Workers run GP tools (CalculateGeometryAttributes, memory staging), and arcpy geoprocessing
+# is not thread-safe, so values above 1 are opt-in and unsupported.
+MAX_WORKERS       = 1
+POLY_BATCH_MIN    = 10        # *_A layers in one GDB sharing SR + units calculated in one staged GP call; 0 = off
 
 # Optional strict validator for polygon area classification
 STRICT_AREA_POLICY = False    # True = abort if any *_A unclassified or sets overlap
@@ -80,9 +88,19 @@ SKIPPED_CSV= os.path.join(_home, f"geometry_calc_skipped_{_ts}.csv")
 logging.basicConfig(filename=LOG_PATH, level=logging.INFO, format="%(asctime)s | %(levelname)s | %(message)s")
 log = logging.getLogger("GeomCalc")
 
-def _msg(s):  arcpy.AddMessage(s) if CREATE_MESSAGES else None;  log.info(s)
-def _warn(s): arcpy.AddWarning(s) if CREATE_MESSAGES else None; log.warning(s)
-def _err(s):  arcpy.AddError(s) if CREATE_MESSAGES else None;   log.error(s)
+# %-style args are formatted lazily: logging formats only if the record is emitted,
+# and the GP message is only built when CREATE_MESSAGES is on.
+def _msg(s, *args):
+    log.info(s, *args)
+    if CREATE_MESSAGES: arcpy.AddMessage(s % args if args else s)
+
+def _warn(s, *args):
+    log.warning(s, *args)
+    if CREATE_MESSAGES: arcpy.AddWarning(s % args if args else s)
+
+def _err(s, *args):
+    log.error(s, *args)
+    if CREATE_MESSAGES: arcpy.AddError(s % args if args else s)
 
 # =================== CSV SCHEMAS & BUFFERS ===================
 
@@ -101,106 +119,164 @@ _SKIPPED_HEADER = [
     "action","reason","layer_sr_wkid","layer_sr_name","catalog_path"
 ]
 
-_UPDATED_ROWS = []  # populated when action == "processed"
-_SKIPPED_ROWS = []  # populated when action in {"skipped","non_compliant","error"}
+# One record per audited layer, in _AUDIT_HEADER order; the updated and skipped
+# reports are projected from it at the end of the run.
+_AuditRow = namedtuple("_AuditRow", _AUDIT_HEADER)
+_AUDIT_ROWS = []
+_CSV_BUFFER = 1 << 18  # 256 KB write buffer for report CSVs
+_SKIPPED_ACTIONS = {"skipped","non_compliant","error"}
+
+_AUDIT_FH = None     # persistent audit handle (opened once in run())
+_AUDIT_WRITER = None
+_AUDIT_LOCK = threading.Lock()  # guards the audit writer and _AUDIT_ROWS across workers
+
+_HEADERS_WRITTEN = set()  # paths already checked this session; skips the stat afterwards
 
 def _ensure_header(path, header):
+    if path in _HEADERS_WRITTEN: return
     if not os.path.exists(path):
         with open(path, "w", newline="", encoding="utf-8") as f:
             csv.writer(f).writerow(header)
+    _HEADERS_WRITTEN.add(path)
+
+def _open_audit():
+    global _AUDIT_FH, _AUDIT_WRITER
+    _AUDIT_FH = open(AUDIT_CSV, "a", buffering=_CSV_BUFFER, newline="", encoding="utf-8")
+    _AUDIT_WRITER = csv.writer(_AUDIT_FH)
+
+def _close_audit():
+    global _AUDIT_FH, _AUDIT_WRITER
+    if _AUDIT_FH is not None:
+        _AUDIT_FH.flush()
+        _AUDIT_FH.close()
+    _AUDIT_FH = _AUDIT_WRITER = None
 
 def _write_updated_skipped_reports():
-    if _UPDATED_ROWS:
-        _ensure_header(UPDATED_CSV, _UPDATED_HEADER)
-        with open(UPDATED_CSV, "a", newline="", encoding="utf-8") as f:
-            w = csv.writer(f)
-            for r in _UPDATED_ROWS:
-                w.writerow([
-                    r["timestamp_utc"], r["map"], r["layer"], r["shape_type"], r["has_z"],
-                    r["outputs"], r["created_fields"], r["updated_fields"],
-                    r["area_unit"], r["length_unit"], r["layer_sr_wkid"], r["layer_sr_name"], r["catalog_path"]
-                ])
-    if _SKIPPED_ROWS:
-        _ensure_header(SKIPPED_CSV, _SKIPPED_HEADER)
-        with open(SKIPPED_CSV, "a", newline="", encoding="utf-8") as f:
+    # Column projections of an audit tuple (see _AUDIT_HEADER)
+    updated = (r[0:5] + r[7:14] + r[15:16] for r in _AUDIT_ROWS if r.action == "processed")
+    skipped = (r[0:7] + r[12:14] + r[15:16] for r in _AUDIT_ROWS if r.action in _SKIPPED_ACTIONS)
+    for path, header, rows in ((UPDATED_CSV, _UPDATED_HEADER, updated),
+                               (SKIPPED_CSV, _SKIPPED_HEADER, skipped)):
+        first = next(rows, None)
+        if first is None: continue
+        _ensure_header(path, header)
+        with open(path, "a", buffering=_CSV_BUFFER, newline="", encoding="utf-8") as f:
             w = csv.writer(f)
-            for r in _SKIPPED_ROWS:
-                w.writerow([
-                    r["timestamp_utc"], r["map"], r["layer"], r["shape_type"], r["has_z"],
-                    r["action"], r["reason"], r["layer_sr_wkid"], r["layer_sr_name"], r["catalog_path"]
-                ])
+            w.writerow(first)
+            w.writerows(rows)
+
+_LAST_TS = (0, "")  # (epoch second, ISO string); reused while the second is unchanged
 
-def _audit_row(map_name, layer_name, shape_type, has_z, action, reason, outputs,
+def _utc_stamp():
+    global _LAST_TS
+    now = int(time.time())
+    sec, text = _LAST_TS
+    if now != sec:
+        text = datetime.utcfromtimestamp(now).isoformat(timespec="seconds") + "Z"
+        _LAST_TS = (now, text)
+    return text
+
+def _audit_row(map_name, layer_name, shape_type, has_z, action, reason, outputs_joined,
                created_fields, updated_fields, area_unit, length_unit,
                sr_wkid, sr_name, coord_format, catalog_path):
-    # master audit (append-as-you-go)
-    _ensure_header(AUDIT_CSV, _AUDIT_HEADER)
-    ts = datetime.utcnow().isoformat(timespec="seconds") + "Z"
-    with open(AUDIT_CSV, "a", newline="", encoding="utf-8") as f:
-        csv.writer(f).writerow([
-            ts, map_name or "", layer_name or "", shape_type or "", bool(has_z),
-            action or "", reason or "",
-            ";".join(outputs) if outputs else "",
-            ";".join(created_fields) if created_fields else "",
-            ";".join(updated_fields) if updated_fields else "",
-            area_unit or "", length_unit or "",
-            sr_wkid or "", sr_name or "", coord_format or "", catalog_path or ""
-        ])
-    # secondary reports
-    if action == "processed":
-        _UPDATED_ROWS.append({
-            "timestamp_utc": ts, "map": map_name or "", "layer": layer_name or "",
-            "shape_type": shape_type or "", "has_z": bool(has_z),
-            "outputs": ";".join(outputs) if outputs else "",
-            "created_fields": ";".join(created_fields) if created_fields else "",
-            "updated_fields": ";".join(updated_fields) if updated_fields else "",
-            "area_unit": area_unit or "", "length_unit": length_unit or "",
-            "layer_sr_wkid": sr_wkid or "", "layer_sr_name": sr_name or "",
-            "catalog_path": catalog_path or ""
-        })
-    elif action in {"skipped","non_compliant","error"}:
-        _SKIPPED_ROWS.append({
-            "timestamp_utc": ts, "map": map_name or "", "layer": layer_name or "",
-            "shape_type": shape_type or "", "has_z": bool(has_z),
-            "action": action, "reason": reason or "",
-            "layer_sr_wkid": sr_wkid or "", "layer_sr_name": sr_name or "",
-            "catalog_path": catalog_path or ""
-        })
+    ts = _utc_stamp()
+    row = _AuditRow(
+        ts, map_name or "", layer_name or "", shape_type or "", bool(has_z),
+        action or "", reason or "",
+        outputs_joined or "",
+        ";".join(created_fields) if created_fields else "",
+        ";".join(updated_fields) if updated_fields else "",
+        area_unit or "", length_unit or "",
+        sr_wkid or "", sr_name or "", coord_format or "", catalog_path or ""
+    )
+    with _AUDIT_LOCK:
+        # master audit (persistent handle; flushed/closed at end of run())
+        _AUDIT_WRITER.writerow(row)
+        _AUDIT_ROWS.append(row)
 
 # =================== HELPERS ===================
 
+# Describe is a COM round-trip; memoize it per layer object for the run.
+# The layer is held alongside its Describe so id(lyr) cannot be recycled.
+_DESC_CACHE = {}
+
+def _desc(lyr):
+    hit = _DESC_CACHE.get(id(lyr))
+    if hit is None:
+        hit = _DESC_CACHE[id(lyr)] = (lyr, arcpy.Describe(lyr))
+    return hit[1]
+
+# Per-layer values the calculators need, derived once in process_layer
+_LayerMeta = namedtuple("_LayerMeta", "cat sr shape_type has_z")
+
+_VALID_SUFFIX_SHAPE = {("_P","Point"), ("_L","Polyline"), ("_A","Polygon")}
+
 def _targets_suffix(lname: str) -> bool:
-    return isinstance(lname, str) and lname.endswith(("_A","_L","_P"))
+    return isinstance(lname, str) and len(lname) >= 2 and lname[-2] == "_" and lname[-1] in "ALP"
 
 def _suffix_matches(lname: str, shape_type: str) -> bool:
-    return (
-        (lname.endswith("_P") and shape_type == "Point") or
-        (lname.endswith("_L") and shape_type == "Polyline") or
-        (lname.endswith("_A") and shape_type == "Polygon")
-    )
+    return (lname[-2:], shape_type) in _VALID_SUFFIX_SHAPE
 
 def _catalog_path(lyr) -> str:
-    try: return arcpy.Describe(lyr).catalogPath
+    try: return _desc(lyr).catalogPath
     except Exception:
         try: return getattr(lyr, "dataSource", "")
         except Exception: return ""
 
 def _layer_sr_info(lyr):
     try:
-        sr = arcpy.Describe(lyr).spatialReference
+        sr = _desc(lyr).spatialReference
         return getattr(sr, "factoryCode", ""), getattr(sr, "name", "")
     except Exception:
         return "", ""
 
+# Many layers share one dataset/GDB; probe each path once per run (cleared in run())
+_EXISTS_CACHE = {}
+_WS_OF_CACHE  = {}
+_LOCK_CACHE   = {}
+_VERSIONED_CACHE = {}
+
+def _container_missing(path: str) -> bool:
+    """True when a path inside a .gdb/.sde names a container that is not on disk."""
+    low = path.lower()
+    for ext in (".gdb", ".sde"):
+        i = low.find(ext)
+        while i != -1:
+            end = i + len(ext)
+            if low[end:end + 1] in ("", "\\", "/"):
+                return not os.path.exists(path[:end])
+            i = low.find(ext, end)
+    return False
+
 def _exists(path: str) -> bool:
-    try: return bool(path) and arcpy.Exists(path)
-    except Exception: return False
+    if not path: return False
+    hit = _EXISTS_CACHE.get(path)
+    if hit is None:
+        # Cheap disk check first; arcpy.Exists opens the workspace
+        if _container_missing(path): hit = False
+        else:
+            try: hit = bool(arcpy.Exists(path))
+            except Exception: hit = False
+        _EXISTS_CACHE[path] = hit
+    return hit
 
 def _workspace_of(path: str) -> str:
-    try: return arcpy.Describe(path).path
-    except Exception:
-        try: return arcpy.da.Describe(path).get("path", "")
-        except Exception: return ""
+    hit = _WS_OF_CACHE.get(path)
+    if hit is None:
+        try: hit = arcpy.Describe(path).path
+        except Exception:
+            try: hit = arcpy.da.Describe(path).get("path", "")
+            except Exception: hit = ""
+        _WS_OF_CACHE[path] = hit
+    return hit
+
+def _is_versioned(path: str) -> bool:
+    hit = _VERSIONED_CACHE.get(path)
+    if hit is None:
+        try: hit = bool(getattr(arcpy.Describe(path), "isVersioned", False))
+        except Exception: hit = False
+        _VERSIONED_CACHE[path] = hit
+    return hit
 
 def _workspace_reachable(path: str) -> bool:
     wsp = _workspace_of(path)
@@ -209,56 +285,83 @@ def _workspace_reachable(path: str) -> bool:
 def _is_feature_layer(lyr) -> bool:
     if not getattr(lyr, "isFeatureLayer", False): return False
     try:
-        d = arcpy.Describe(lyr)
+        d = _desc(lyr)
         return getattr(d, "dataType", "") in {"FeatureLayer","FeatureLayerView"} and hasattr(d, "shapeType")
     except Exception:
         return False
 
 def _geom_type(lyr) -> str:
-    return arcpy.Describe(lyr).shapeType
+    return _desc(lyr).shapeType
 
 def _has_z(lyr) -> bool:
-    try: return bool(getattr(arcpy.Describe(lyr), "hasZ", False))
+    try: return bool(getattr(_desc(lyr), "hasZ", False))
     except Exception: return False
 
+# .mapserver / .featureserver / /wms / /wmts in one case-insensitive scan
+_SERVICE_RE = re.compile(r"\.(?:map|feature)server|/wmt?s", re.IGNORECASE)
+
 def _is_virtual_or_service(lyr) -> bool:
     try:
-        d = arcpy.Describe(lyr)
-        src = (getattr(d, "dataSource", "") or "").lower()
-        is_service = any(s in src for s in (".mapserver",".featureserver","/wms","/wmts"))
+        d = _desc(lyr)
+        is_service = bool(_SERVICE_RE.search(getattr(d, "dataSource", "") or ""))
         has_join  = bool(getattr(d, "hasJoin", False))
         return is_service or has_join
     except Exception:
         return False
 
 def _schema_lock_ok(cat_path: str) -> bool:
-    try: return arcpy.TestSchemaLock(cat_path)
-    except Exception: return False
-
-def _field_names_lower(obj):
-    try: return {f.name.lower() for f in arcpy.ListFields(obj)}
+    # Keyed by dataset, not workspace: locks are held per feature class
+    hit = _LOCK_CACHE.get(cat_path)
+    if hit is None:
+        try: hit = bool(arcpy.TestSchemaLock(cat_path))
+        except Exception: hit = False
+        _LOCK_CACHE[cat_path] = hit
+    return hit
+
+def _field_names_lower(lyr):
+    # Field list from the cached layer Describe; avoids a separate ListFields call
+    try: return {f.name.lower() for f in getattr(_desc(lyr), "fields", ())}
     except Exception: return set()
 
-def _classify_fields(existing_lower, targets):
-    to_create, to_update = [], []
-    for t in targets:
-        (to_update if t.lower() in existing_lower else to_create).append(t)
+def _with_lc(names):
+    return tuple((n, n.lower()) for n in names)
+
+# Output fields per geometry as (name, lowercase name), lowered once at load
+_OUT_LINES    = _with_lc(["lengthSize","latitudeFrom","latitudeTo","longitudeFrom","longitudeTo"])
+_OUT_LINES_Z  = _OUT_LINES + _with_lc(["elevationFrom","elevationTo"])
+_OUT_POLYGONS = _with_lc(["areaSize","perimeterSize","latitude","longitude"])
+_OUT_POINTS   = _with_lc(["longitude","latitude"])
+_OUT_POINTS_Z = _OUT_POINTS + _with_lc(["elevation"])
+
+# Audit "outputs" column per target list, joined once
+_OUTPUTS_JOINED = {t: ";".join(n for n, _ in t)
+                   for t in (_OUT_LINES, _OUT_LINES_Z, _OUT_POLYGONS, _OUT_POINTS, _OUT_POINTS_Z)}
+
+def _classify_fields(existing_lower, targets_with_lc):
+    to_create = [t for t, tl in targets_with_lc if tl not in existing_lower]
+    to_update = [t for t, tl in targets_with_lc if tl in existing_lower]
     return to_create, to_update
 
 def _noncompliant(map_name, lyr, reason, shape_type=""):
     lname = getattr(lyr, "name", "?")
     cat = _catalog_path(lyr)
     sr_wkid, sr_name = _layer_sr_info(lyr)
-    _warn(f"[{map_name}] {lname}: {reason}")
-    _audit_row(map_name, lname, shape_type, False, "non_compliant", reason, [], [], [],
+    _warn("[%s] %s: %s", map_name, lname, reason)
+    _audit_row(map_name, lname, shape_type, False, "non_compliant", reason, "", [], [],
                "", "", sr_wkid, sr_name, "", cat)
 
 # Units derived from layer SR (optional)
 def _units_from_sr(sr):
     try:
-        unit = (sr.linearUnitName or "").lower()
+        unit = sr.linearUnitName or ""
     except Exception:
         unit = ""
+    return _units_from_unit_name(unit)
+
+@lru_cache(maxsize=64)
+def _units_from_unit_name(unit_name):
+    # Projects carry only a handful of distinct SRs; classify each unit name once
+    unit = unit_name.lower()
     if "meter" in unit:
         return ("METERS", "SQUARE_METERS", "HECTARES")
     if "foot" in unit and ("us" in unit or "survey" in unit):
@@ -299,8 +402,8 @@ def _validate_area_policy(map_list):
 
 # =================== CALCULATIONS (geodesic, per-layer SR) ===================
 
-def _calc_lines(lyr, lname, map_name, hasz, shape_type, cat):
-    sr = arcpy.Describe(lyr).spatialReference
+def _calc_lines(lyr, lname, map_name, meta):
+    sr, hasz, shape_type, cat = meta.sr, meta.has_z, meta.shape_type, meta.cat
     if not sr or getattr(sr, "factoryCode", 0) in (0, None):
         _noncompliant(map_name, lyr, "Layer has unknown spatial reference", shape_type)
         return
@@ -308,9 +411,8 @@ def _calc_lines(lyr, lname, map_name, hasz, shape_type, cat):
     length_unit = _units_from_sr(sr)[0] if UNITS_FROM_LAYER else LENGTH_UNIT_US
     coord_format = "DD" if getattr(sr, "type", "").lower() == "geographic" else ""
 
-    outputs = ["lengthSize","latitudeFrom","latitudeTo","longitudeFrom","longitudeTo"]
-    if hasz: outputs += ["elevationFrom","elevationTo"]
-    to_create, to_update = _classify_fields(_field_names_lower(lyr), outputs)
+    targets = _OUT_LINES_Z if hasz else _OUT_LINES
+    to_create, to_update = _classify_fields(_field_names_lower(lyr), targets)
 
     props = [
         "lengthSize LENGTH_GEODESIC",
@@ -329,90 +431,245 @@ def _calc_lines(lyr, lname, map_name, hasz, shape_type, cat):
         coordinate_format=coord_format,
     )
 
-    _msg(f"[{map_name}] {lname}: lines calculated (GEODESIC; SR={sr.factoryCode} {sr.name}).")
+    _msg("[%s] %s: lines calculated (GEODESIC; SR=%s %s).", map_name, lname, sr.factoryCode, sr.name)
     _audit_row(map_name, lname, shape_type, hasz, "processed", "",
-               outputs, to_create, to_update, "", length_unit,
+               _OUTPUTS_JOINED[targets], to_create, to_update, "", length_unit,
                getattr(sr,"factoryCode",""), getattr(sr,"name",""), coord_format, cat)
 
+# Layer name -> area unit; built lowest-precedence first so SQFT > SQYD > ACRES on overlap
+_AREA_UNIT_MAP = {n: "ACRES_US" for n in AREA_ACRES_A}
+_AREA_UNIT_MAP.update({n: "SQUARE_YARDS_US" for n in AREA_SQYD_A})
+_AREA_UNIT_MAP.update({n: "SQUARE_FEET_US" for n in AREA_SQFT_A})
+
 def _resolve_polygon_area_unit(lname, sr):
-    if lname in AREA_SQFT_A:  return "SQUARE_FEET_US"
-    if lname in AREA_SQYD_A:  return "SQUARE_YARDS_US"
-    if lname in AREA_ACRES_A: return "ACRES_US"
+    unit = _AREA_UNIT_MAP.get(lname)
+    if unit: return unit
     if not UNITS_FROM_LAYER:  return AREA_DEFAULT_A
     # UNITS_FROM_LAYER: derive sensible default from SR (acres only when explicit)
     return _units_from_sr(sr)[1]  # SQUARE_METERS or SQUARE_FEET_US
 
-def _calc_polygons(lyr, lname, map_name, hasz, shape_type, cat):
-    sr = arcpy.Describe(lyr).spatialReference
+_POLY_PROPS = ";".join([
+    "areaSize AREA_GEODESIC",
+    "perimeterSize PERIMETER_LENGTH_GEODESIC",
+    "latitude INSIDE_Y",
+    "longitude INSIDE_X",
+])
+_POLY_FIELDS = [t for t, _ in _OUT_POLYGONS]
+
+# A polygon layer whose calculation is deferred to the end of its workspace group
+_PolyJob = namedtuple("_PolyJob", "lyr lname map_name meta area_unit length_unit coord_format to_update")
+
+def _calc_polygons(lyr, lname, map_name, meta, batch=None):
+    sr = meta.sr
     if not sr or getattr(sr, "factoryCode", 0) in (0, None):
-        _noncompliant(map_name, lyr, "Layer has unknown spatial reference", shape_type)
+        _noncompliant(map_name, lyr, "Layer has unknown spatial reference", meta.shape_type)
         return
 
     length_unit = _units_from_sr(sr)[0] if UNITS_FROM_LAYER else LENGTH_UNIT_US
     area_unit = _resolve_polygon_area_unit(lname, sr)
     coord_format = "DD" if getattr(sr, "type", "").lower() == "geographic" else ""
 
-    outputs = ["areaSize","perimeterSize","latitude","longitude"]
-    to_create, to_update = _classify_fields(_field_names_lower(lyr), outputs)
+    to_create, to_update = _classify_fields(_field_names_lower(lyr), _OUT_POLYGONS)
+    job = _PolyJob(lyr, lname, map_name, meta, area_unit, length_unit, coord_format, to_update)
 
-    props = [
-        "areaSize AREA_GEODESIC",
-        "perimeterSize PERIMETER_LENGTH_GEODESIC",
-        "latitude INSIDE_Y",
-        "longitude INSIDE_X",
-    ]
+    if batch is not None and not to_create:
+        # Outputs already exist: defer so same-SR/unit layers can share one GP call
+        batch.append(job)
+        return
 
+    _polygon_tool(job, lyr)
+    _polygons_done(job, to_create)
+
+def _polygon_tool(job, in_features):
     arcpy.management.CalculateGeometryAttributes(
-        in_features=lyr,
-        geometry_property=";".join(props),
-        length_unit=length_unit,
-        area_unit=area_unit,
-        coordinate_system=sr,
-        coordinate_format=coord_format,
+        in_features=in_features,
+        geometry_property=_POLY_PROPS,
+        length_unit=job.length_unit,
+        area_unit=job.area_unit,
+        coordinate_system=job.meta.sr,
+        coordinate_format=job.coord_format,
     )
 
-    _msg(f"[{map_name}] {lname}: polygons calculated (GEODESIC; area={area_unit}; SR={sr.factoryCode} {sr.name}).")
-    _audit_row(map_name, lname, shape_type, hasz, "processed", "",
-               outputs, to_create, to_update, area_unit, length_unit,
-               getattr(sr,"factoryCode",""), getattr(sr,"name",""), coord_format, cat)
+def _polygons_done(job, to_create):
+    sr = job.meta.sr
+    _msg("[%s] %s: polygons calculated (GEODESIC; area=%s; SR=%s %s).",
+         job.map_name, job.lname, job.area_unit, sr.factoryCode, sr.name)
+    _audit_row(job.map_name, job.lname, job.meta.shape_type, job.meta.has_z, "processed", "",
+               _OUTPUTS_JOINED[_OUT_POLYGONS], to_create, job.to_update, job.area_unit, job.length_unit,
+               getattr(sr,"factoryCode",""), getattr(sr,"name",""), job.coord_format, job.meta.cat)
+
+def _calc_polygons_staged(jobs):
+    """
+    Copy several polygon layers (same SR and units) into one memory feature
+    class, run CalculateGeometryAttributes once, then write the values back
+    to each source layer by OID. Selections/definition queries are honored
+    because the copy and the write-back both go through the layer. Source
+    OIDs stay in Python (src_idx is the row's position in `sources`), so
+    64-bit ObjectIDs never pass through a 32-bit field.
+    """
+    name = f"geomcalc_stage_{threading.get_ident()}"
+    stage = f"memory\\{name}"
+    arcpy.management.CreateFeatureclass("memory", name, "POLYGON", spatial_reference=jobs[0].meta.sr)
+    try:
+        arcpy.management.AddField(stage, "src_idx", "LONG")
+        sources = []  # src_idx -> (job index, source OID)
+        with arcpy.da.InsertCursor(stage, ["SHAPE@", "src_idx"]) as ic:
+            for i, job in enumerate(jobs):
+                with arcpy.da.SearchCursor(job.lyr, ["SHAPE@", "OID@"]) as sc:
+                    for shp, oid in sc:
+                        ic.insertRow((shp, len(sources)))
+                        sources.append((i, oid))
+
+        _polygon_tool(jobs[0], stage)
+
+        values = [{} for _ in jobs]
+        with arcpy.da.SearchCursor(stage, ["src_idx"] + _POLY_FIELDS) as sc:
+            for row in sc:
+                i, oid = sources[row[0]]
+                values[i][oid] = row[1:]
+
+        for job, vals in zip(jobs, values):
+            with _edit_session(job.meta.cat):
+                with arcpy.da.UpdateCursor(job.lyr, ["OID@"] + _POLY_FIELDS) as cur:
+                    for row in cur:
+                        v = vals.get(row[0])
+                        if v is not None:
+                            cur.updateRow([row[0], *v])
+    finally:
+        # Scratch cleanup must not mask the real error or fail a batch that succeeded
+        try:
+            arcpy.management.Delete(stage)
+        except Exception:
+            pass
 
-def _calc_points(lyr, lname, map_name, hasz, shape_type, cat):
-    sr = arcpy.Describe(lyr).spatialReference
+def _flush_polygon_batch(batch, counters):
+    """Calculate deferred polygon layers: staged per (SR, units) group when large enough."""
+    groups = {}
+    for job in batch:
+        key = (job.meta.sr.factoryCode, job.area_unit, job.length_unit, job.coord_format)
+        groups.setdefault(key, []).append(job)
+
+    for jobs in groups.values():
+        if len(jobs) >= POLY_BATCH_MIN:
+            try:
+                _calc_polygons_staged(jobs)
+                for job in jobs: _polygons_done(job, [])
+                continue
+            except Exception as e:
+                _warn("Staged polygon batch (%d layers) failed; calculating per layer: %s", len(jobs), e)
+        for job in jobs:
+            try:
+                _polygon_tool(job, job.lyr)
+                _polygons_done(job, [])
+            except Exception as e:
+                counters["processed"] -= 1  # counted when the job was queued
+                sr = job.meta.sr
+                _layer_error(job.map_name, job.lname, e, getattr(sr,"factoryCode",""),
+                             getattr(sr,"name",""), job.meta.cat, counters)
+
+def _calc_points(lyr, lname, map_name, meta):
+    sr, hasz, shape_type, cat = meta.sr, meta.has_z, meta.shape_type, meta.cat
     if not sr or getattr(sr, "factoryCode", 0) in (0, None):
         _noncompliant(map_name, lyr, "Layer has unknown spatial reference", shape_type)
         return
 
     coord_format = "DD" if getattr(sr, "type", "").lower() == "geographic" else ""
 
-    outputs = ["longitude","latitude"] + (["elevation"] if hasz else [])
-    to_create, to_update = _classify_fields(_field_names_lower(lyr), outputs)
-
-    props = ["longitude POINT_X","latitude POINT_Y"] + (["elevation POINT_Z"] if hasz else [])
-
-    arcpy.management.CalculateGeometryAttributes(
-        in_features=lyr,
-        geometry_property=";".join(props),
-        length_unit="", area_unit="",
-        coordinate_system=sr,
-        coordinate_format=coord_format,
-    )
-
-    _msg(f"[{map_name}] {lname}: points calculated (SR={sr.factoryCode} {sr.name}).")
+    targets = _OUT_POINTS_Z if hasz else _OUT_POINTS
+    to_create, to_update = _classify_fields(_field_names_lower(lyr), targets)
+
+    if to_create:
+        # The GP tool adds missing output fields; keep it for first-time layers
+        props = ["longitude POINT_X","latitude POINT_Y"] + (["elevation POINT_Z"] if hasz else [])
+        arcpy.management.CalculateGeometryAttributes(
+            in_features=lyr,
+            geometry_property=";".join(props),
+            length_unit="", area_unit="",
+            coordinate_system=sr,
+            coordinate_format=coord_format,
+        )
+    else:
+        _cursor_points(lyr, cat, hasz)
+
+    _msg("[%s] %s: points calculated (SR=%s %s).", map_name, lname, sr.factoryCode, sr.name)
     _audit_row(map_name, lname, shape_type, hasz, "processed", "",
-               outputs, to_create, to_update, "", "",
+               _OUTPUTS_JOINED[targets], to_create, to_update, "", "",
                getattr(sr,"factoryCode",""), getattr(sr,"name",""), coord_format, cat)
 
+def _edit_workspace(cat):
+    """Geodatabase root of a catalog path (walks up past feature datasets); '' if none."""
+    p = cat or ""
+    while p and not p.lower().endswith((".gdb", ".sde")):
+        parent = os.path.dirname(p)
+        if parent == p: return ""
+        p = parent
+    return p
+
+@contextmanager
+def _edit_session(cat):
+    """Edit session on the dataset's geodatabase; plain cursor edits if none can start."""
+    ws = _edit_workspace(cat)
+    editor = None
+    if ws:
+        try:
+            editor = arcpy.da.Editor(ws)
+            # Multiuser only for versioned data; file GDB and non-versioned enterprise use single-user
+            editor.startEditing(False, _is_versioned(cat))
+            editor.startOperation()
+        except Exception as ex:
+            log.warning(f"Edit session unavailable for {ws}; updating without one: {ex}")
+            editor = None
+    ok = False
+    try:
+        yield
+        ok = True
+    finally:
+        if editor is not None:
+            editor.stopOperation() if ok else editor.abortOperation()
+            editor.stopEditing(ok)
+
+def _cursor_points(lyr, cat, hasz):
+    """
+    Write X/Y(/Z) straight from the SHAPE tokens. Values are in the layer SR,
+    matching POINT_X/POINT_Y/POINT_Z, and the layer's selection/definition
+    query is honored just as the GP tool does.
+    """
+    fields = ["SHAPE@XY", "longitude", "latitude"] + (["SHAPE@Z", "elevation"] if hasz else [])
+    with _edit_session(cat):
+        with arcpy.da.UpdateCursor(lyr, fields) as cur:
+            for row in cur:
+                x, y = row[0] or (None, None)
+                row[1], row[2] = x, y
+                if hasz: row[4] = row[3]
+                cur.updateRow(row)
+
 # =================== PROCESS ONE LAYER ===================
 
-def process_layer(lyr, map_name, counters):
+_CALC = {"_L": _calc_lines, "_A": _calc_polygons, "_P": _calc_points}
+
+def _layer_error(map_name, lname, e, sr_wkid, sr_name, cat, counters):
+    if isinstance(e, arcpy.ExecuteError):
+        msg = arcpy.GetMessages(2) or str(e)
+        _err("[%s] %s: ExecuteError: %s", map_name, lname, msg)
+        reason = f"ExecuteError: {msg}"
+    else:
+        _err("[%s] %s: %s: %s", map_name, lname, type(e).__name__, e)
+        reason = f"{type(e).__name__}: {e}"
+    _audit_row(map_name, lname, "", False, "error", reason, "", [], [],
+               "", "", sr_wkid, sr_name, "", cat)
+    counters["errors"] += 1
+
+def process_layer(lyr, map_name, counters, batch=None):
     lname = getattr(lyr, "name", "?")
-    cat = _catalog_path(lyr)
-    sr_wkid, sr_name = _layer_sr_info(lyr)
 
+    # Suffix gate first: non-targeted layers are audited without any Describe
     if not _targets_suffix(lname):
         _audit_row(map_name, lname, "", False, "skipped", "Suffix policy not targeted",
-                   [], [], [], "", "", sr_wkid, sr_name, "", cat)
+                   "", [], [], "", "", "", "", "", "")
         counters["skipped"] += 1; return
+
+    cat = _catalog_path(lyr)
+    sr_wkid, sr_name = _layer_sr_info(lyr)
     if not _is_feature_layer(lyr):
         _noncompliant(map_name, lyr, "Not a feature layer with geometry"); counters["noncompliant"] += 1; return
 
@@ -433,42 +690,52 @@ def process_layer(lyr, map_name, counters):
             _noncompliant(map_name, lyr, f"Name-suffix vs shapeType mismatch: {shape_type}", shape_type)
             counters["noncompliant"] += 1; return
 
-        hasz = _has_z(lyr)
+        meta = _LayerMeta(cat, _desc(lyr).spatialReference, shape_type, _has_z(lyr))
 
-        if lname.endswith("_L"): _calc_lines(lyr, lname, map_name, hasz, shape_type, cat)
-        elif lname.endswith("_A"): _calc_polygons(lyr, lname, map_name, hasz, shape_type, cat)
-        elif lname.endswith("_P"): _calc_points(lyr, lname, map_name, hasz, shape_type, cat)
+        calc = _CALC[lname[-2:]]
+        if calc is _calc_polygons: calc(lyr, lname, map_name, meta, batch)
+        else: calc(lyr, lname, map_name, meta)
 
         counters["processed"] += 1
 
-    except arcpy.ExecuteError as ee:
-        msg = arcpy.GetMessages(2) or str(ee)
-        _err(f"[{map_name}] {lname}: ExecuteError: {msg}")
-        _audit_row(map_name, lname, "", False, "error", f"ExecuteError: {msg}", [], [], [],
-                   "", "", sr_wkid, sr_name, "", cat)
-        counters["errors"] += 1
     except Exception as e:
-        _err(f"[{map_name}] {lname}: {type(e).__name__}: {e}")
-        _audit_row(map_name, lname, "", False, "error", f"{type(e).__name__}: {e}", [], [], [],
-                   "", "", sr_wkid, sr_name, "", cat)
-        counters["errors"] += 1
+        _layer_error(map_name, lname, e, sr_wkid, sr_name, cat, counters)
 
 # =================== TRAVERSAL ===================
 
 def iter_leaf_layers(map_obj):
-    """Depth-first traversal. Descend into any layer exposing listLayers(); yield leaves."""
-    stack = deque(map_obj.listLayers())
+    """Depth-first traversal. Descend into group layers; yield leaves."""
+    stack = list(map_obj.listLayers())
     while stack:
         lyr = stack.pop()
-        try:
-            subs = lyr.listLayers()
-            if subs:
-                for sub in subs: stack.append(sub)
-                continue
-        except Exception:
-            pass
+        is_group = getattr(lyr, "isGroupLayer", None)
+        if is_group is None:
+            # No isGroupLayer on this object; fall back to probing listLayers()
+            try: subs = lyr.listLayers()
+            except Exception: subs = None
+        else:
+            subs = lyr.listLayers() if is_group else None
+        if subs:
+            stack.extend(subs)
+            continue
         yield lyr
 
+def _process_group(items):
+    """Process one workspace's layers sequentially; returns that group's counters."""
+    counters = {"processed":0, "skipped":0, "noncompliant":0, "errors":0}
+    batch = [] if POLY_BATCH_MIN else None
+    for lyr, map_name in items:
+        process_layer(lyr, map_name, counters, batch)
+    if batch:
+        _flush_polygon_batch(batch, counters)
+    return counters
+
+def _group_key(lyr):
+    # Non-targeted layers are only audited, so skip the Describe needed to place them
+    if not _targets_suffix(getattr(lyr, "name", "")): return ""
+    cat = _catalog_path(lyr)
+    return (_edit_workspace(cat) or _workspace_of(cat)) if cat else ""
+
 # =================== MAIN ===================
 
 def run():
@@ -483,10 +750,32 @@ def run():
     _msg("Geometry calc start | Maps: " + ", ".join(m.name for m in maps))
 
     counters = {"processed":0, "skipped":0, "noncompliant":0, "errors":0}
-    for m in maps:
-        _msg(f"Scanning map: {m.name}")
-        for lyr in iter_leaf_layers(m):
-            process_layer(lyr, m.name, counters)
+    for cache in (_EXISTS_CACHE, _WS_OF_CACHE, _LOCK_CACHE, _VERSIONED_CACHE): cache.clear()
+    _ensure_header(AUDIT_CSV, _AUDIT_HEADER)  # once per run; rows never re-check
+    _open_audit()
+    try:
+        # Group by geodatabase so two workers never edit the same GDB at once
+        groups = {}
+        for m in maps:
+            _msg(f"Scanning map: {m.name}")
+            for lyr in iter_leaf_layers(m):
+                groups.setdefault(_group_key(lyr), []).append((lyr, m.name))
+
+        workers = max(1, min(MAX_WORKERS, len(groups)))
+        if workers == 1:
+            for items in groups.values():
+                for k, v in _process_group(items).items(): counters[k] += v
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                futures = {ex.submit(_process_group, items): ws for ws, items in groups.items()}
+                for fut in as_completed(futures):
+                    try:
+                        for k, v in fut.result().items(): counters[k] += v
+                    except Exception as e:
+                        _err(f"Workspace failed: {futures[fut] or '(none)'}: {type(e).__name__}: {e}")
+    finally:
+        _close_audit()
+        _DESC_CACHE.clear()
 
     # Write secondary reports
     _write_updated_skipped_reports()
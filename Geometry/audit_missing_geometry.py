@@ -13,7 +13,7 @@ Purpose:
 
 What is flagged:
   • CheckGeometry problems (self-intersections, null parts, etc.).
-  • Empty shapes (SHAPE@ is None or isEmpty).
+  • Empty shapes (null SHAPE@AREA / SHAPE@LENGTH / SHAPE@XY).
   • Zero-area polygons.
   • Zero-length polylines.
 
@@ -29,8 +29,10 @@ Outputs (project home):
 ================================================================================
 """
 
-import arcpy, os, csv, logging, datetime
-from collections import OrderedDict, deque
+import arcpy, os, re, csv, logging, datetime, hashlib
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # -------------------- Project context & outputs ------------------------------
 APRX = arcpy.mp.ArcGISProject("CURRENT")
@@ -43,6 +45,8 @@ CSV_SCANNED  = os.path.join(HOME, f"bad_geometry_scanned_{TS}.csv")
 CSV_SKIPPED  = os.path.join(HOME, f"bad_geometry_skipped_{TS}.csv")
 LOG_PATH     = os.path.join(HOME, f"bad_geometry_log_{TS}.log")
 
+MAX_WORKERS  = 4  # feature classes checked concurrently; 1 = sequential
+
 logging.basicConfig(filename=LOG_PATH, level=logging.INFO, format="%(asctime)s | %(levelname)s | %(message)s")
 log = logging.getLogger("BadGeom")
 
@@ -52,12 +56,26 @@ def err(s): arcpy.AddError(s);    log.error(s)
 
 # -------------------- Layer & dataset utilities ------------------------------
 
+# Describe is a COM round-trip and the same layer/path is described several times
+# per run. Paths are keyed by string; layers by id() with the layer held alongside
+# so the id cannot be recycled while cached.
+_DESCRIBE_CACHE = {}
+
+def _describe(obj):
+    key = obj if isinstance(obj, str) else id(obj)
+    hit = _DESCRIBE_CACHE.get(key)
+    if hit is None:
+        hit = _DESCRIBE_CACHE[key] = (obj, arcpy.Describe(obj))
+    return hit[1]
+
+# .mapserver / .featureserver / /wms / /wmts in one case-insensitive scan
+_SERVICE_RE = re.compile(r"\.(?:map|feature)server|/wmt?s", re.IGNORECASE)
+
 def is_service_or_virtual(lyr) -> bool:
     """Skip map/feature services, WMS/WMTS, or layers with joins."""
     try:
-        d = arcpy.Describe(lyr)
-        src = (getattr(d, "dataSource", "") or "").lower()
-        if any(s in src for s in (".mapserver", ".featureserver", "/wms", "/wmts")):
+        d = _describe(lyr)
+        if _SERVICE_RE.search(getattr(d, "dataSource", "") or ""):
             return True
         return bool(getattr(d, "hasJoin", False))
     except Exception:
@@ -66,7 +84,7 @@ def is_service_or_virtual(lyr) -> bool:
 def resolve_dataset_path(lyr) -> str:
     """Prefer Describe.catalogPath; fall back to lyr.dataSource."""
     try:
-        d = arcpy.Describe(lyr)
+        d = _describe(lyr)
         cp = getattr(d, "catalogPath", "") or ""
         if cp: return cp
         return getattr(lyr, "dataSource", "") or ""
@@ -79,14 +97,14 @@ def resolve_dataset_path(lyr) -> str:
 def is_feature_class(path: str) -> bool:
     try:
         if not path or not arcpy.Exists(path): return False
-        dt = getattr(arcpy.Describe(path), "dataType", "").lower()
+        dt = getattr(_describe(path), "dataType", "").lower()
         return dt in {"featureclass", "featureclassshapefile"}
     except Exception:
         return False
 
 def shape_type(path: str) -> str:
     try:
-        return arcpy.Describe(path).shapeType
+        return _describe(path).shapeType
     except Exception:
         return ""
 
@@ -95,226 +113,388 @@ def iter_leaf_layers_active_map():
     m = APRX.activeMap
     if not m:
         return
-    stack = deque(m.listLayers())
+    stack = list(m.listLayers())
     while stack:
         lyr = stack.pop()
+        if getattr(lyr, "isGroupLayer", False):
+            stack.extend(lyr.listLayers())
+            continue
+        if getattr(lyr, "isFeatureLayer", False):
+            yield lyr  # plain feature layer: a leaf, no listLayers() probe needed
+            continue
+        # Other types (composites etc.): probe for sublayers
         try:
             subs = lyr.listLayers()
             if subs:
-                for s in subs: stack.append(s)
+                stack.extend(subs)
                 continue
         except Exception:
             pass
         yield lyr
 
+class Cand:
+    """One dataset referenced by the map: layer names pointing at it, and whether all are eligible."""
+    __slots__ = ("layer_refs", "eligible")
+
+    def __init__(self):
+        self.layer_refs = set()
+        self.eligible = True
+
 def gather_active_map_featureclasses():
     """
-    Return dict[fc_catalog_path] -> {'layer_refs': set(layer names in map)}.
-    Deduplicates multiple references to the same dataset.
+    Return dict[fc_catalog_path] -> Cand.
+    Deduplicates multiple references to the same dataset. A dataset is not
+    eligible if any layer referencing it is a service/virtual/joined layer.
     """
     cands = OrderedDict()
     for lyr in iter_leaf_layers_active_map():
         # Skip non-feature layers up front
         if not getattr(lyr, "isFeatureLayer", False):
             continue
-        # Skip services/virtual/joined
-        if is_service_or_virtual(lyr):
-            # will be recorded as skipped later when evaluated
-            pass
         path = resolve_dataset_path(lyr)
         if not path:
             continue
         try:
-            cp = arcpy.Describe(path).catalogPath
+            cp = _describe(path).catalogPath
         except Exception:
             cp = path
-        entry = cands.setdefault(cp, {"layer_refs": set(), "lyr_objs": []})
-        entry["layer_refs"].add(getattr(lyr, "name", ""))
-        entry["lyr_objs"].append(lyr)
+        cand = cands.get(cp)
+        if cand is None:
+            cand = cands[cp] = Cand()
+        cand.layer_refs.add(getattr(lyr, "name", ""))
+        # Services/virtual/joined are recorded as skipped when evaluated. One bad
+        # reference already disqualifies the dataset, so later ones are not tested.
+        if cand.eligible and is_service_or_virtual(lyr):
+            cand.eligible = False
     return cands
 
 # -------------------- CheckGeometry + direct checks --------------------------
 
+def _scratch_gdb():
+    return arcpy.env.scratchGDB or arcpy.CreateFileGDB_management(HOME, f"_scratch_{TS}.gdb").getOutput(0)
+
+# CheckGeometry output column candidates by role, in preference order
+CHECK_COLUMNS = {
+    "oid":  ("OID", "OBJECTID", "FEATURE_ID", "FID", "ORIG_FID", "SOURCE_OID"),
+    "prob": ("PROBLEM", "Problem", "PROBLEM_TYPE", "ProblemType"),
+    "desc": ("DESCRIPTION", "Problem_Description", "PROBLEM_DESC", "ProblemDescript"),
+    "x":    ("X", "POINT_X"),
+    "y":    ("Y", "POINT_Y"),
+}
+
+def _read_check_table(out_table, extra=()):
+    """
+    Read a CheckGeometry output table as canonical (oid, prob, desc, x, y)
+    tuples, None where this version's schema lacks a column. `extra` columns
+    (e.g. CLASS) are prepended to each tuple.
+    """
+    field_set = {f.name for f in arcpy.ListFields(out_table)}
+    picked = [next((c for c in cands if c in field_set), None) for cands in CHECK_COLUMNS.values()]
+    present = [c for c in picked if c]
+
+    ne = len(extra)
+    slots = []  # cursor position per canonical column, None when absent
+    for c in picked:
+        slots.append(ne + present.index(c) if c else None)
+    rows = []
+    with arcpy.da.SearchCursor(out_table, list(extra) + (present or ["OID@"])) as cur:
+        for r in cur:
+            rows.append(r[:ne] + tuple(r[i] if i is not None else None for i in slots))
+    return rows
+
+def check_geometry_batch(fc_paths):
+    """
+    One CheckGeometry call over every dataset, rows bucketed by the CLASS column.
+    Returns {fc_path: [(oid, prob, desc, x, y), ...]}, or None if the batched call cannot be used
+    (the caller then falls back to check_geometry per dataset).
+    """
+    if not fc_paths:
+        return {}
+    norm = lambda p: os.path.normcase(os.path.normpath(p or ""))
+    out_table = os.path.join(_scratch_gdb(), f"chk_all_{TS}")
+    try:
+        arcpy.management.CheckGeometry(list(fc_paths), out_table)  # read-only; overwrites
+
+        if "CLASS" not in {f.name for f in arcpy.ListFields(out_table)}:
+            raise RuntimeError("output table has no CLASS column")
+        buckets = {norm(p): [] for p in fc_paths}
+        for row in _read_check_table(out_table, ("CLASS",)):
+            bucket = buckets.get(norm(row[0]))
+            if bucket is None:
+                raise RuntimeError("CLASS value does not match an input dataset")
+            bucket.append(row[1:])
+        return {p: buckets[norm(p)] for p in fc_paths}
+    except Exception as ex:
+        warn(f"Batched CheckGeometry unavailable; checking datasets one at a time: {ex}")
+        return None
+    finally:
+        try: arcpy.Delete_management(out_table)
+        except Exception: pass
+
 def check_geometry(fc_path):
     """
-    Run CheckGeometry and return a list of dict rows describing problems.
-    The output schema varies by version; we select common fields and fallback.
+    Run CheckGeometry on one dataset. Returns (rows, error): rows are canonical
+    (oid, prob, desc, x, y) tuples; error is the failure text or None.
     """
     rows = []
     try:
-        scratch = arcpy.env.scratchGDB or arcpy.CreateFileGDB_management(HOME, f"_scratch_{TS}.gdb").getOutput(0)
-        out_table = os.path.join(scratch, f"chk_{abs(hash(fc_path)) % 1000000}")
-        if arcpy.Exists(out_table):
-            arcpy.Delete_management(out_table)
-        arcpy.management.CheckGeometry(fc_path, out_table)  # read-only
-
-        fields = [f.name for f in arcpy.ListFields(out_table)]
-        pick = lambda *cands: next((c for c in cands if c in fields), None)
-
-        f_oid  = pick("OID", "OBJECTID", "FEATURE_ID", "FID", "ORIG_FID", "SOURCE_OID")
-        f_prob = pick("PROBLEM", "Problem", "PROBLEM_TYPE", "ProblemType")
-        f_desc = pick("DESCRIPTION", "Problem_Description", "PROBLEM_DESC", "ProblemDescript")
-        f_x    = pick("X", "POINT_X")
-        f_y    = pick("Y", "POINT_Y")
-
-        use_fields = [c for c in (f_oid, f_prob, f_desc, f_x, f_y) if c] or fields
-        with arcpy.da.SearchCursor(out_table, use_fields) as cur:
-            for r in cur:
-                rec = {"issue_source": "CheckGeometry"}
-                for i, col in enumerate(use_fields):
-                    rec[col] = r[i]
-                rows.append(rec)
+        # Content-addressed name: stable per dataset, so reruns overwrite rather than accumulate
+        digest = hashlib.blake2b(fc_path.encode("utf-8"), digest_size=6).hexdigest()
+        out_table = os.path.join(_scratch_gdb(), f"chk_{digest}")
+        arcpy.management.CheckGeometry(fc_path, out_table)  # read-only; overwrites
+
+        rows = _read_check_table(out_table)
 
         try: arcpy.Delete_management(out_table)
         except Exception: pass
 
     except Exception as ex:
         err(f"{fc_path} | CheckGeometry error: {ex}")
-        rows.append({"issue_source": "CheckGeometry", "error": str(ex)})
-    return rows
+        return rows, str(ex)
+    return rows, None
+
+def zero_measure_where(fc_path, shp_type):
+    """
+    SQL pre-filter on the geodatabase-maintained Shape_Area / Shape_Length field,
+    so only offending rows reach Python. None when the dataset has no such field
+    (shapefiles) or exposes it as a function (enterprise ST_Geometry/SQL types).
+    """
+    if shp_type not in ("Polygon", "Polyline"):
+        return None
+    try:
+        d = _describe(fc_path)
+        fld = getattr(d, "areaFieldName" if shp_type == "Polygon" else "lengthFieldName", "") or ""
+    except Exception:
+        return None
+    if not fld or "(" in fld:
+        return None
+    q = arcpy.AddFieldDelimiters(fc_path, fld)
+    return f"{q} = 0 OR {q} IS NULL"
+
+def count_rows(fc_path):
+    """Row count from GetCount (table metadata, no row pass); a GP tool, so main thread only."""
+    try:
+        return int(arcpy.management.GetCount(fc_path).getOutput(0))
+    except Exception:
+        return ""
+
+def _scan_measure(cur, zero_code, out):
+    """Polygon/Polyline rows of (OID, SHAPE@AREA|SHAPE@LENGTH); returns rows visited."""
+    n = 0
+    for oid, val in cur:
+        n += 1
+        if val is None:
+            out.append({"issue_source": "Direct", "issue_code": "EMPTY_SHAPE", "OID": oid})
+        elif val == 0.0:
+            out.append({"issue_source": "Direct", "issue_code": zero_code, "OID": oid})
+    return n
+
+def _scan_point(cur, out):
+    """Point/Multipoint rows of (OID, SHAPE@XY); emptiness only. Returns rows visited."""
+    n = 0
+    for oid, xy in cur:
+        n += 1
+        if xy is None or xy[0] is None:
+            out.append({"issue_source": "Direct", "issue_code": "EMPTY_SHAPE", "OID": oid})
+    return n
+
+def _scan_numpy(fc_path, tokens, where, zero_code, out):
+    """
+    Same checks as the cursor loops, read in one FeatureClassToNumPyArray call
+    (geometry tokens need the feature-class variant); nulls come back as NaN
+    and offending OIDs are picked with masks. Returns row count.
+    """
+    arr = arcpy.da.FeatureClassToNumPyArray(fc_path, tokens, where_clause=where, null_value=np.nan)
+    oids, vals = arr[tokens[0]], arr[tokens[1]]
+    if vals.ndim > 1:
+        vals = vals[:, 0]  # SHAPE@XY: X is NaN for null points
+    for oid in oids[np.isnan(vals)].tolist():
+        out.append({"issue_source": "Direct", "issue_code": "EMPTY_SHAPE", "OID": oid})
+    if zero_code:
+        for oid in oids[vals == 0.0].tolist():
+            out.append({"issue_source": "Direct", "issue_code": zero_code, "OID": oid})
+    return len(arr)
 
 def scan_empty_zero(fc_path, shp_type):
-    """Direct cursor checks for empty shapes, zero-area polygons, zero-length polylines."""
+    """
+    Direct cursor checks for empty shapes, zero-area polygons, zero-length polylines.
+    Returns (issues, feature count); the count is "" if it could not be read and
+    None when the scan was where-filtered (the caller fills it with count_rows).
+    """
     issues = []
+    feat_ct = ""
+    # Lightweight tokens only: SHAPE@AREA / SHAPE@LENGTH / SHAPE@XY come back None
+    # for null shapes, so no full geometry object is built per row. The shape-type
+    # branch is taken once here, not per row.
+    if shp_type == "Polygon":
+        tokens, zero_code = ["OID@", "SHAPE@AREA"], "ZERO_AREA_POLYGON"
+        scan = lambda cur: _scan_measure(cur, zero_code, issues)
+    elif shp_type == "Polyline":
+        tokens, zero_code = ["OID@", "SHAPE@LENGTH"], "ZERO_LENGTH_POLYLINE"
+        scan = lambda cur: _scan_measure(cur, zero_code, issues)
+    else:  # Point / Multipoint
+        tokens, zero_code = ["OID@", "SHAPE@XY"], None
+        scan = lambda cur: _scan_point(cur, issues)
     try:
-        tokens = ["OID@", "SHAPE@", "SHAPE@AREA", "SHAPE@LENGTH"]
-        with arcpy.da.SearchCursor(fc_path, tokens) as cur:
-            for oid, geom, area, length in cur:
-                if geom is None or geom.isEmpty:
-                    issues.append({"issue_source": "Direct", "issue_code": "EMPTY_SHAPE", "OID": oid})
-                    continue
-                if shp_type == "Polygon":
-                    if area is None or float(area) == 0.0:
-                        issues.append({"issue_source": "Direct", "issue_code": "ZERO_AREA_POLYGON", "OID": oid})
-                elif shp_type == "Polyline":
-                    if length is None or float(length) == 0.0:
-                        issues.append({"issue_source": "Direct", "issue_code": "ZERO_LENGTH_POLYLINE", "OID": oid})
+        where = zero_measure_where(fc_path, shp_type)
+        try:
+            visited = _scan_numpy(fc_path, tokens, where, zero_code, issues)
+        except MemoryError as ex:
+            # Table too large to hold as one array: stream with a cursor instead
+            log.info(f"{fc_path} | array scan unavailable ({ex}); using cursor")
+            del issues[:]
+            with arcpy.da.SearchCursor(fc_path, tokens, where_clause=where) as cur:
+                visited = scan(cur)
+        # Unfiltered scans already saw every row; filtered ones are counted by the caller
+        feat_ct = visited if where is None else None
     except Exception as ex:
         issues.append({"issue_source": "Direct", "error": str(ex)})
-    return issues
+    return issues, feat_ct
+
+def process_fc(fc_path, shp, layer_refs, cg_rows, cg_error=None):
+    """
+    CheckGeometry findings + direct scan + feature count for one dataset.
+    cg_rows/cg_error come from CheckGeometry, already run on the main thread;
+    only read-only cursor work happens here. Returns (finding rows, skipped
+    rows, scanned row); touches no CSV itself.
+    """
+    findings, skipped = [], []
+
+    if cg_error:
+        skipped.append([fc_path, f"CheckGeometry error: {cg_error}"])
+    for foid, issue_type, issue_desc, x, y in cg_rows:
+        findings.append([fc_path, layer_refs, shp, "CheckGeometry",
+                         issue_type or "", issue_desc or "", foid or "", x or "", y or ""])
+
+    direct_rows, feat_ct = scan_empty_zero(fc_path, shp)
+    for rec in direct_rows:
+        if "error" in rec:
+            skipped.append([fc_path, f"Direct scan error: {rec['error']}"])
+            continue
+        findings.append([
+            fc_path, layer_refs, shp, "Direct",
+            rec.get("issue_code",""), "",
+            rec.get("OID",""), "", ""
+        ])
+
+    return findings, skipped, [fc_path, shp, feat_ct, len(findings)]
 
 # -------------------- Main ---------------------------------------------------
 
 def run():
     arcpy.env.addOutputsToMap = False
+    # Scratch CheckGeometry tables are overwritten in place instead of Exists + Delete
+    prev_overwrite = arcpy.env.overwriteOutput
+    arcpy.env.overwriteOutput = True
+    try:
+        _run()
+    finally:
+        arcpy.env.overwriteOutput = prev_overwrite
 
-    # Prepare ledgers
-    with open(CSV_FINDINGS, "w", newline="", encoding="utf-8") as f:
-        csv.writer(f).writerow([
+def _run():
+
+    # Ledgers stay open for the whole run; rows go through long-lived writers
+    f_find = open(CSV_FINDINGS, "w", newline="", encoding="utf-8", buffering=1 << 20)
+    f_scan = open(CSV_SCANNED,  "w", newline="", encoding="utf-8", buffering=1 << 20)
+    f_skip = open(CSV_SKIPPED,  "w", newline="", encoding="utf-8", buffering=1 << 20)
+    try:
+        w_find, w_scan, w_skip = csv.writer(f_find), csv.writer(f_scan), csv.writer(f_skip)
+        w_find.writerow([
             "DatasetPath","LayerRefs","ShapeType","IssueSource","IssueCodeOrType",
             "IssueDescription","FeatureOID","X","Y"
         ])
-    with open(CSV_SCANNED, "w", newline="", encoding="utf-8") as f:
-        csv.writer(f).writerow(["DatasetPath","ShapeType","Features","Issues"])
-    with open(CSV_SKIPPED, "w", newline="", encoding="utf-8") as f:
-        csv.writer(f).writerow(["DatasetPath","Reason"])
-
-    if APRX.activeMap is None:
-        err("No active map. Open a map and re-run.")
-        msg(f"Findings CSV: {CSV_FINDINGS}")
-        msg(f"Scanned CSV:  {CSV_SCANNED}")
-        msg(f"Skipped CSV:  {CSV_SKIPPED}")
-        msg(f"Log:          {LOG_PATH}")
-        return
-
-    cands = gather_active_map_featureclasses()
-    if not cands:
-        err("Active map contains no feature layers with resolvable datasets.")
-        msg(f"Findings CSV: {CSV_FINDINGS}")
-        msg(f"Scanned CSV:  {CSV_SCANNED}")
-        msg(f"Skipped CSV:  {CSV_SKIPPED}")
-        msg(f"Log:          {LOG_PATH}")
-        return
-
-    msg(f"Feature classes to scan (active map): {len(cands)}")
+        w_scan.writerow(["DatasetPath","ShapeType","Features","Issues"])
+        w_skip.writerow(["DatasetPath","Reason"])
+
+        if APRX.activeMap is None:
+            err("No active map. Open a map and re-run.")
+            msg(f"Findings CSV: {CSV_FINDINGS}")
+            msg(f"Scanned CSV:  {CSV_SCANNED}")
+            msg(f"Skipped CSV:  {CSV_SKIPPED}")
+            msg(f"Log:          {LOG_PATH}")
+            return
+
+        cands = gather_active_map_featureclasses()
+        if not cands:
+            err("Active map contains no feature layers with resolvable datasets.")
+            msg(f"Findings CSV: {CSV_FINDINGS}")
+            msg(f"Scanned CSV:  {CSV_SCANNED}")
+            msg(f"Skipped CSV:  {CSV_SKIPPED}")
+            msg(f"Log:          {LOG_PATH}")
+            return
+
+        msg(f"Feature classes to scan (active map): {len(cands)}")
+
+        total_fc = 0
+        total_issues = 0
+        eligible = []      # (fc_path, shape_type, layer_refs) that passed the pre-checks
+        pre_skipped = []   # pre-check skip rows, written in one batch
+
+        for fc_path, cand in cands.items():
+            total_fc += 1
+            layer_refs = ";".join(sorted(cand.layer_refs))
+
+            # Validate dataset path
+            if not arcpy.Exists(fc_path):
+                pre_skipped.append([fc_path, "Dataset not found"])
+                msg(f"{fc_path} | <skipped: not found>")
+                continue
 
-    total_fc = 0
-    total_issues = 0
+            # Skip service/virtual/joined datasets (cannot run CheckGeometry reliably)
+            if not cand.eligible:
+                pre_skipped.append([fc_path, "Service/virtual/joined layer not eligible"])
+                msg(f"{fc_path} | <skipped: service/virtual/joined>")
+                continue
 
-    for fc_path, meta in cands.items():
-        total_fc += 1
-        layer_refs = ";".join(sorted(meta.get("layer_refs", []))) if meta.get("layer_refs") else ""
+            shp = shape_type(fc_path)
+            if shp not in {"Point","Polyline","Polygon","Multipoint"}:
+                pre_skipped.append([fc_path, f"Unsupported shape type: {shp}"])
+                msg(f"{fc_path} | <skipped: {shp}>")
+                continue
 
-        # Validate dataset path
-        if not arcpy.Exists(fc_path):
-            with open(CSV_SKIPPED, "a", newline="", encoding="utf-8") as f:
-                csv.writer(f).writerow([fc_path, "Dataset not found"])
-            msg(f"{fc_path} | <skipped: not found>")
-            continue
+            eligible.append((fc_path, shp, layer_refs))
+
+        w_skip.writerows(pre_skipped)
+
+        # CheckGeometry once for all eligible datasets, else one dataset at a time. Either way it
+        # runs here on the main thread: GP tools are not thread-safe and the scratch GDB takes
+        # one writer at a time
+        cg = check_geometry_batch([fc for fc, _, _ in eligible])
+        cg_errors = {}
+        if cg is not None:
+            msg(f"CheckGeometry (batched): {len(eligible)} datasets")
+        else:
+            cg = {}
+            for fc, _, _ in eligible:
+                cg[fc], cg_errors[fc] = check_geometry(fc)
+
+        # Read-only scans run concurrently; CSVs are written here, serially, as results arrive
+        workers = max(1, min(MAX_WORKERS, len(eligible)))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            futures = {ex.submit(process_fc, *item, cg[item[0]], cg_errors.get(item[0])): item
+                       for item in eligible}
+            for fut in as_completed(futures):
+                fc_path, shp, _ = futures[fut]
+                try:
+                    findings, skipped, scanned = fut.result()
+                except Exception as e:
+                    w_skip.writerow([fc_path, f"Error: {e}"])
+                    err(f"{fc_path} | ERROR: {e}")
+                    continue
 
-        # Skip service/virtual/joined datasets (cannot run CheckGeometry reliably)
-        try:
-            # If any source layer for this dataset is service/virtual/joined, treat as not eligible
-            for lyr in meta.get("lyr_objs", []):
-                if is_service_or_virtual(lyr):
-                    with open(CSV_SKIPPED, "a", newline="", encoding="utf-8") as f:
-                        csv.writer(f).writerow([fc_path, "Service/virtual/joined layer not eligible"])
-                    msg(f"{fc_path} | <skipped: service/virtual/joined>")
-                    raise StopIteration
-        except StopIteration:
-            continue
+                if scanned[2] is None:
+                    scanned[2] = count_rows(fc_path)  # GetCount on the main thread
 
-        shp = shape_type(fc_path)
-        if shp not in {"Point","Polyline","Polygon","Multipoint"}:
-            with open(CSV_SKIPPED, "a", newline="", encoding="utf-8") as f:
-                csv.writer(f).writerow([fc_path, f"Unsupported shape type: {shp}"])
-            msg(f"{fc_path} | <skipped: {shp}>")
-            continue
+                w_find.writerows(findings)
+                w_skip.writerows(skipped)
+                w_scan.writerow(scanned)
+                # One flush per dataset so a crash keeps every finished FC on disk
+                for f in (f_find, f_scan, f_skip): f.flush()
 
-        # Run checks
-        try:
-            cg_rows = check_geometry(fc_path)
-            direct_rows = scan_empty_zero(fc_path, shp)
-
-            # Write findings
-            issues_here = 0
-            with open(CSV_FINDINGS, "a", newline="", encoding="utf-8") as f:
-                w = csv.writer(f)
-
-                # CheckGeometry results
-                for rec in cg_rows:
-                    if "error" in rec:
-                        with open(CSV_SKIPPED, "a", newline="", encoding="utf-8") as fs:
-                            csv.writer(fs).writerow([fc_path, f"CheckGeometry error: {rec['error']}"])
-                        continue
-                    issue_type = rec.get("PROBLEM") or rec.get("Problem") or rec.get("PROBLEM_TYPE") or rec.get("ProblemType") or ""
-                    issue_desc = rec.get("DESCRIPTION") or rec.get("Problem_Description") or rec.get("PROBLEM_DESC") or ""
-                    foid = rec.get("OID") or rec.get("OBJECTID") or rec.get("FEATURE_ID") or rec.get("FID") or rec.get("ORIG_FID") or rec.get("SOURCE_OID") or ""
-                    x = rec.get("X") or rec.get("POINT_X") or ""
-                    y = rec.get("Y") or rec.get("POINT_Y") or ""
-                    w.writerow([fc_path, layer_refs, shp, "CheckGeometry", issue_type, issue_desc, foid, x, y])
-                    issues_here += 1
-
-                # Direct rows
-                for rec in direct_rows:
-                    if "error" in rec:
-                        with open(CSV_SKIPPED, "a", newline="", encoding="utf-8") as fs:
-                            csv.writer(fs).writerow([fc_path, f"Direct scan error: {rec['error']}"])
-                        continue
-                    w.writerow([
-                        fc_path, layer_refs, shp, "Direct",
-                        rec.get("issue_code",""), "",
-                        rec.get("OID",""), "", ""
-                    ])
-                    issues_here += 1
-
-            total_issues += issues_here
-
-            # Feature count
-            try:
-                feat_ct = int(arcpy.management.GetCount(fc_path)[0])
-            except Exception:
-                feat_ct = ""
-
-            with open(CSV_SCANNED, "a", newline="", encoding="utf-8") as f:
-                csv.writer(f).writerow([fc_path, shp, feat_ct, issues_here])
-
-            msg(f"{fc_path} | shape={shp} | features={feat_ct} | issues={issues_here}")
-
-        except Exception as ex:
-            with open(CSV_SKIPPED, "a", newline="", encoding="utf-8") as f:
-                csv.writer(f).writerow([fc_path, f"Error: {ex}"])
-            err(f"{fc_path} | ERROR: {ex}")
+                total_issues += len(findings)
+                msg(f"{fc_path} | shape={shp} | features={scanned[2]} | issues={len(findings)}")
+    finally:
+        for f in (f_find, f_scan, f_skip): f.close()
 
     # Summary
     msg("----- Summary -----")
@@ -22,7 +22,7 @@ Outputs (written next to the input CSV):
   - <input>_appended_<ts>.csv
   - <input>_included_features_audit_<ts>.csv
   - <input>_excluded_features_audit_<ts>.csv
-  - <input>_space_trim_audit_<ts>.csv
+  - <input>_space_trim_audit_<ts>.csv (only when a facility number needed trimming)
   - geometry_extraction_log_<ts>.txt (log file)
 
 Behavioral guarantees:
@@ -38,6 +38,8 @@ import os
 import csv
 import datetime
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 # ===================== HARD-CODED INPUT CSV =====================
 # Replace the placeholder below with the absolute path to your Nexgen pull CSV.
@@ -48,6 +50,9 @@ CSV_FACNUM_HEADERS = ["Fac Nbr", "Facility Number", "FacilityNumber"]
 
 # Owners to exclude after domain decoding (case-insensitive).
 EXCLUDED_OWNERS = {"host nation", "hn"}
+
+# Layer cursors read concurrently; 1 = sequential.
+MAX_WORKERS = 4
 # ================================================================
 
 run_ts = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -66,6 +71,16 @@ output_csv           = _base + f"_appended_{run_ts}.csv"
 included_audit_csv   = _base + f"_included_features_audit_{run_ts}.csv"
 excluded_audit_csv   = _base + f"_excluded_features_audit_{run_ts}.csv"
 space_trim_audit_csv = _base + f"_space_trim_audit_{run_ts}.csv"
+CSV_BUFFER = 1 << 20  # 1 MB write buffer for the output CSVs; fewer write() calls on large audits
+
+# Audit rows are plain tuples in these column orders
+INC_COLS  = ("RunId", "LayerName", "OBJECTID", "FacilityNumber", "RPUID",
+             "CategoryCode", "AreaSize", "LengthSize", "AreaSizeUOM",
+             "LengthUOM", "Reason")
+EXC_COLS  = ("RunId", "LayerName", "OBJECTID", "FacilityNumberRaw", "RPUID",
+             "CategoryCode", "OperationalStatus", "Owner", "AreaSizeRaw",
+             "LengthSizeRaw", "Reason")
+TRIM_COLS = ("Source", "Location", "Context", "OriginalValue", "TrimmedValue")
 
 # ==== LOGGING (alongside CSV) ====
 log_filename = os.path.join(
@@ -89,27 +104,16 @@ if active_map is None:
 # ===================== HELPERS =====================
 
 def iter_feature_layers(container):
-    """Depth-first traversal to leaf feature layers."""
-    from collections import deque
-    stack = deque(container.listLayers() if hasattr(container, "listLayers") else [])
-    while stack:
-        lyr = stack.pop()
-        try:
-            subs = lyr.listLayers()
-            if subs:
-                for s in subs:
-                    stack.append(s)
-                continue
-        except Exception:
-            pass
-        if getattr(lyr, "isFeatureLayer", False):
-            yield lyr
+    """Feature layers at any depth; Map.listLayers() already flattens nested groups."""
+    layers = container.listLayers() if hasattr(container, "listLayers") else []
+    return (lyr for lyr in layers if getattr(lyr, "isFeatureLayer", False))
 
-def get_matching_field(fields, candidates):
+def get_matching_field(field_lookup, candidates):
+    """First candidate present in a make_field_lookup() map; returns the real field name."""
     for cand in candidates:
-        for f in fields:
-            if f.name.lower() == cand.lower():
-                return f.name
+        fld = field_lookup.get(cand.lower())
+        if fld is not None:
+            return fld.name
     return None
 
 def make_field_lookup(fields):
@@ -124,12 +128,12 @@ def is_double_field(field_lookup, name):
 def build_alias_lookup(fields):
     return {f.name: (f.aliasName or "").strip().lower() for f in fields}
 
-def get_field_by_alias(fields, wanted_aliases):
+def get_field_by_alias(alias_lookup, wanted_aliases):
+    """First field (in field order) whose build_alias_lookup() alias is wanted."""
     wanted = {a.strip().lower() for a in wanted_aliases}
-    for f in fields:
-        alias = (f.aliasName or "").strip().lower()
+    for name, alias in alias_lookup.items():
         if alias in wanted:
-            return f.name
+            return name
     return None
 
 def dedup_keep_order(seq):
@@ -139,20 +143,18 @@ def dedup_keep_order(seq):
             out.append(x); seen.add(x)
     return out
 
-def fetch_cell_from_dataset(dataset, oid_field, oid_value, field_name):
-    where = f"{arcpy.AddFieldDelimiters(dataset, oid_field)} = {oid_value}"
-    with arcpy.da.SearchCursor(dataset, [field_name], where) as c:
-        for r in c:
-            return r[0]
-    return None
+_domains_by_workspace = {}  # {workspace: {domain_name: domain}}; ListDomains once per workspace
 
 def build_domain_decoder(workspace, fields):
     decoder = {}
-    try:
-        domains = {d.name: d for d in arcpy.da.ListDomains(workspace)}
-    except Exception as e:
-        logging.debug(f"ListDomains failed for '{workspace}': {e}")
-        return decoder
+    domains = _domains_by_workspace.get(workspace)
+    if domains is None:
+        try:
+            domains = {d.name: d for d in arcpy.da.ListDomains(workspace)}
+        except Exception as e:
+            logging.debug(f"ListDomains failed for '{workspace}': {e}")
+            return decoder
+        _domains_by_workspace[workspace] = domains
     for f in fields:
         dname = getattr(f, "domain", None)
         if not dname:
@@ -163,14 +165,39 @@ def build_domain_decoder(workspace, fields):
             decoder[f.name.lower()] = mapping
     return decoder
 
-def decode_with_domain(field_name, raw_value, field_domain_maps):
+def field_domain_map(field_domain_maps, field_name):
+    """Coded-value mapping for one field from build_domain_decoder(), or None."""
+    return field_domain_maps.get(field_name.lower()) if field_name else None
+
+def decode_with_domain(mapping, raw_value):
+    """Decode with a field_domain_map() result; unknown codes pass through normalized."""
     if raw_value in (None, "", "Null"):
         return ""
-    mapping = field_domain_maps.get(field_name.lower()) if field_name else None
-    if mapping:
-        key = str(raw_value).strip().lower()
-        return mapping.get(key, str(raw_value).strip().lower())
-    return str(raw_value).strip().lower()
+    key = str(raw_value).strip().lower()
+    return mapping.get(key, key) if mapping else key
+
+# Space-trim audit streams straight to disk; the file is only created once a trim is found
+space_trim_fh = None
+space_trim_writer = None
+space_trim_count = 0
+
+def audit_space_trim(source, location, context, original, trimmed):
+    """Write one whitespace-trim audit row, opening the audit CSV on first use."""
+    global space_trim_fh, space_trim_writer, space_trim_count
+    if space_trim_writer is None:
+        space_trim_fh = open(space_trim_audit_csv, 'w', encoding='utf-8-sig', newline='', buffering=CSV_BUFFER)
+        space_trim_writer = csv.writer(space_trim_fh)
+        space_trim_writer.writerow(TRIM_COLS)
+    space_trim_writer.writerow((source, location, context, original, trimmed))
+    space_trim_count += 1
+
+def layer_exclusion(layer_name, reason):
+    """Excluded-audit row for a whole layer (no per-feature values)."""
+    return (run_ts, layer_name, "", "", "", "", "", "", "", "", reason)
+
+def audit_sort_key(row):
+    """(LayerName, OBJECTID) with layer-level rows (blank OID) after the features."""
+    return (row[1], row[2] == "", row[2] or 0)
 
 def make_dataset_key(path):
     try:
@@ -180,13 +207,20 @@ def make_dataset_key(path):
 
 def norm_fac_value(value):
     """Return (lower_stripped, was_trimmed, stripped_value, original_string)."""
-    s = "" if value is None else str(value)
+    if isinstance(value, str):  # CSV cells and text fields; skip the str() copy
+        s = value
+    else:
+        s = "" if value is None else str(value)
     stripped = s.strip()
-    was_trimmed = (stripped != s)
-    return stripped.lower(), was_trimmed, stripped, s
+    # strip() only ever shortens, so a length check replaces the string compare
+    return stripped.lower(), len(stripped) != len(s), stripped, s
 
 # ===================== LOAD CSV + VALIDATE =====================
 
+# Single pass: header validation, key index, and the row list reused for the appended CSV
+csv_data = {}
+csv_rows = []  # [(key_norm, row)] in file order; every input row is written back out
+row_count = 0
 with open(INPUT_CSV, 'r', encoding='utf-8-sig', newline='') as f:
     reader = csv.reader(f)
     try:
@@ -195,46 +229,36 @@ with open(INPUT_CSV, 'r', encoding='utf-8-sig', newline='') as f:
         arcpy.AddError("CSV has no header or rows.")
         raise SystemExit(3)
 
-# Find facility-number column
-fac_col_name = None
-header_lc = [h.strip().lower() for h in header]
-for cand in CSV_FACNUM_HEADERS:
-    if cand.strip().lower() in header_lc:
-        fac_col_name = header[header_lc.index(cand.strip().lower())]
-        break
-
-if fac_col_name is None:
-    arcpy.AddError(
-        "Mandatory facility-number column not found in CSV. "
-        f"CSV must include one of: {', '.join(CSV_FACNUM_HEADERS)}."
-    )
-    raise SystemExit(4)
-
-# Re-open via DictReader to keep all columns
-csv_data = {}
-space_trim_rows = []  # audit of whitespace trims on CSV and dataset sides
-row_count = 0
-with open(INPUT_CSV, 'r', encoding='utf-8-sig', newline='') as f:
-    reader = csv.DictReader(f)
-    if fac_col_name not in reader.fieldnames:
+    # Find facility-number column
+    fac_col_name = None
+    header_lc = [h.strip().lower() for h in header]
+    for cand in CSV_FACNUM_HEADERS:
+        if cand.strip().lower() in header_lc:
+            fac_col_name = header[header_lc.index(cand.strip().lower())]
+            break
+
+    if fac_col_name is None:
         arcpy.AddError(
-            f"CSV field '{fac_col_name}' missing in DictReader. "
-            "Confirm the CSV delimiter and headers."
+            "Mandatory facility-number column not found in CSV. "
+            f"CSV must include one of: {', '.join(CSV_FACNUM_HEADERS)}."
         )
-        raise SystemExit(5)
-    for idx, row in enumerate(reader, start=2):  # start=2 to account for header on row 1
+        raise SystemExit(4)
+
+    fac_idx = header.index(fac_col_name)
+    width = len(header)
+    for row in reader:
+        if not row:
+            continue  # blank line (DictReader skipped these too)
+        if len(row) < width:
+            row += [""] * (width - len(row))
         row_count += 1
-        key_norm, was_trimmed, stripped, original = norm_fac_value(row.get(fac_col_name, ""))
+        idx = row_count + 1  # data rows start on line 2
+        key_norm, was_trimmed, stripped, original = norm_fac_value(row[fac_idx])
         if was_trimmed:
-            space_trim_rows.append({
-                "Source": "CSV",
-                "Location": os.path.basename(INPUT_CSV),
-                "Context": f"row={idx}",
-                "OriginalValue": original,
-                "TrimmedValue": stripped
-            })
+            audit_space_trim("CSV", os.path.basename(INPUT_CSV), f"row={idx}", original, stripped)
         if key_norm:
             csv_data[key_norm] = row
+        csv_rows.append((key_norm, row))
 
 if row_count == 0:
     arcpy.AddError("CSV contains a header but no data rows.")
@@ -248,366 +272,429 @@ results = {}  # fac -> aggregates
 included_audit_rows = []
 excluded_audit_rows = []
 
-processed_oids = set()   # {(dataset_key, OBJECTID)}
-first_seen_layer = {}    # {(dataset_key, OBJECTID): layer_name}
+# Processed features keyed by one int, (dataset id << 64) | OBJECTID, instead of a
+# (path, OID) tuple; 64 bits leaves room for 64-bit ObjectIDs.
+dataset_ids = {}         # {dataset_key: small int}
+first_seen_layer = {}    # {dataset_bits | OBJECTID: layer_name}
+
+# Several layers often point at one feature class; Describe/ListFields/domains once per dataset
+dataset_info_cache = {}  # {dataset_key: (fields, workspace, oid_field, domain_maps, field_lookup, alias_lookup)}
+where_valid_cache = {}   # {(dataset_key, definition_query): bool} from the cursor probe
+datasets_scanned = {}    # {dataset_key: {where_clause_or_None: plan}}; first layer to claim each scan
 
 # ===================== PROCESS ACTIVE MAP =====================
+# Layers are planned in map order on the main thread (Describe, fields, filter, shared
+# caches), their cursors are read on a thread pool, and the rows are merged back in map
+# order so de-duplication still credits the first layer that references a feature.
 
-for lyr in iter_feature_layers(active_map):
+SERVICE_MARKERS = (".mapserver", ".featureserver", "/wms", "/wmts")
+
+def plan_layer(lyr):
+    """Resolve one layer's dataset, fields and filter; None if it is excluded outright."""
+    # Skip services and joined layers; dataset-level read is required. Services show in
+    # the layer's own dataSource, so they are dropped before paying for a Describe.
     try:
-        desc_layer = arcpy.Describe(lyr)
-        # Skip services and joined layers; dataset-level read is required
+        data_src = (lyr.dataSource or "").lower() if lyr.supports("DATASOURCE") else ""
+    except Exception:
+        data_src = ""
+    is_service = any(s in data_src for s in SERVICE_MARKERS)
+    desc_layer = None if is_service else arcpy.Describe(lyr)
+    if not data_src and desc_layer is not None:
         data_src = (getattr(desc_layer, "dataSource", "") or "").lower()
-        if any(s in data_src for s in (".mapserver", ".featureserver", "/wms", "/wmts")) or bool(getattr(desc_layer, "hasJoin", False)):
-            excluded_audit_rows.append({
-                "RunId": run_ts, "LayerName": lyr.name, "OBJECTID": "",
-                "FacilityNumberRaw": "", "RPUID": "", "CategoryCode": "",
-                "OperationalStatus": "", "Owner": "", "AreaSizeRaw": "", "LengthSizeRaw": "",
-                "Reason": "Service or joined layer not eligible for dataset read"
-            })
-            continue
+        is_service = any(s in data_src for s in SERVICE_MARKERS)
+    if is_service or bool(getattr(desc_layer, "hasJoin", False)):
+        excluded_audit_rows.append(layer_exclusion(
+            lyr.name, "Service or joined layer not eligible for dataset read"))
+        return None
+
+    dataset_path = desc_layer.catalogPath
+    if not dataset_path or not arcpy.Exists(dataset_path):
+        excluded_audit_rows.append(layer_exclusion(lyr.name, "Dataset path not found"))
+        return None
+
+    dataset_key = make_dataset_key(dataset_path)
+    info = dataset_info_cache.get(dataset_key)
+    if info is None:
+        dataset_fields = arcpy.ListFields(dataset_path)
+        desc_ds = arcpy.Describe(dataset_path)
+        ws = desc_ds.path
+        info = (dataset_fields, ws, desc_ds.OIDFieldName, build_domain_decoder(ws, dataset_fields),
+                make_field_lookup(dataset_fields), build_alias_lookup(dataset_fields))
+        dataset_info_cache[dataset_key] = info
+    dataset_fields, ws, oid_dataset, dataset_domain_maps, field_lookup, alias_lookup = info
+
+    layer_fields = desc_layer.fields if hasattr(desc_layer, "fields") else arcpy.ListFields(lyr)
+    layer_lookup = make_field_lookup(layer_fields)
+
+    # Dataset field matches
+    f_rpuid   = get_matching_field(field_lookup, ["rpuid","RPUID"])
+    f_facnum  = get_matching_field(field_lookup, ["facilityNumber"])
+    f_catcode = get_matching_field(field_lookup, ["categoryCode"])
+    f_area    = get_matching_field(field_lookup, ["areaSize"])
+    f_owner   = get_matching_field(field_lookup, ["owner"])
+    f_status  = get_matching_field(field_lookup, ["operationalStatus"])
+    f_area_u  = get_matching_field(field_lookup, ["areaSizeUom"])
+
+    # Fallbacks on layer if missing on dataset
+    f_owner_layer  = None if f_owner else get_matching_field(layer_lookup, ["owner"])
+    f_status_layer = None if f_status else get_matching_field(layer_lookup, ["operationalStatus"])
+
+    # Domain mappings resolved per field once; the layer decoder only matters for fallbacks
+    layer_domain_maps = build_domain_decoder(ws, layer_fields) if (f_owner_layer or f_status_layer) else {}
+    owner_domain  = field_domain_map(dataset_domain_maps, f_owner) if f_owner else field_domain_map(layer_domain_maps, f_owner_layer)
+    status_domain = field_domain_map(dataset_domain_maps, f_status) if f_status else field_domain_map(layer_domain_maps, f_status_layer)
+
+    # Length candidates
+    cand_len_primary   = get_matching_field(field_lookup, ["lengthSize"])
+    cand_len_fallback  = get_matching_field(field_lookup, ["measuredLength"])
+    primary_is_double  = is_double_field(field_lookup, cand_len_primary)
+    fallback_is_double = is_double_field(field_lookup, cand_len_fallback)
+    if primary_is_double and fallback_is_double:
+        f_length, length_choice_note = cand_len_primary, "selected 'lengthSize' (Double; both candidates Double)"
+    elif primary_is_double:
+        f_length, length_choice_note = cand_len_primary, "selected 'lengthSize' (Double)"
+    elif fallback_is_double:
+        f_length, length_choice_note = cand_len_fallback, "selected fallback 'measuredLength' (Double)"
+    else:
+        f_length, length_choice_note = (cand_len_primary if cand_len_primary else cand_len_fallback,
+                                        "no length field available" if not (cand_len_primary or cand_len_fallback)
+                                        else ("selected 'lengthSize' (non-Double)" if cand_len_primary and cand_len_primary.lower() == "lengthsize"
+                                              else "selected fallback 'measuredLength' (non-Double)"))
+    if f_length and f_length.lower() == "measuredlength":
+        f_length_u = get_matching_field(field_lookup, ["measuredLengthUom"]) or get_matching_field(field_lookup, ["lengthSizeUom"])
+    else:
+        f_length_u = get_matching_field(field_lookup, ["lengthSizeUom"]) or get_matching_field(field_lookup, ["measuredLengthUom"])
+
+    # Facility number candidates (alias-aware)
+    f_facnum_alias = get_field_by_alias(alias_lookup, ["Facility Number","FacilityNumber","Fac Nbr"])
+    catcode_is_fac = bool(f_catcode and alias_lookup.get(f_catcode, "") == "facility number")
+    facnum_candidates = dedup_keep_order([f_facnum, f_facnum_alias, f_catcode if catcode_is_fac else None])
+
+    if not facnum_candidates:
+        excluded_audit_rows.append(layer_exclusion(
+            lyr.name, "No facility-number candidates found in dataset fields"))
+        return None
+
+    # OIDs and re{BASE_CODE}le field list
+    oid_layer   = desc_layer.OIDFieldName  # usually same as oid_dataset
+    fields_to_read = [oid_dataset] + dedup_keep_order([
+        f_rpuid, f_catcode, f_area, f_length, f_owner, f_status, f_area_u, f_length_u
+    ] + facnum_candidates)
+
+    # Respect layer definition query if valid on dataset
+    layer_def = getattr(lyr, "definitionQuery", None)
+    where_for_dataset = layer_def or None
+    if where_for_dataset:
+        probe_key = (dataset_key, where_for_dataset)
+        valid = where_valid_cache.get(probe_key)
+        if valid is None:
+            try:
+                with arcpy.da.SearchCursor(dataset_path, [oid_dataset], where_for_dataset):
+                    pass
+                valid = True
+            except Exception:
+                valid = False
+            where_valid_cache[probe_key] = valid
+        if not valid:
+            where_for_dataset = None
 
-        dataset_path = desc_layer.catalogPath
-        if not dataset_path or not arcpy.Exists(dataset_path):
-            excluded_audit_rows.append({
-                "RunId": run_ts, "LayerName": lyr.name, "OBJECTID": "",
-                "FacilityNumberRaw": "", "RPUID": "", "CategoryCode": "",
-                "OperationalStatus": "", "Owner": "", "AreaSizeRaw": "", "LengthSizeRaw": "",
-                "Reason": "Dataset path not found"
-            })
+    plan = {
+        "lyr": lyr, "layer_name": lyr.name, "prior": None, "failed": False, "single_cursor": False,
+        "dataset_path": dataset_path, "dataset_key": dataset_key,
+        "fields_to_read": fields_to_read, "where": where_for_dataset, "layer_def": layer_def,
+        "oid_layer": oid_layer, "f_owner_layer": f_owner_layer, "f_status_layer": f_status_layer,
+        "f_owner": f_owner, "f_status": f_status,
+        "owner_domain": owner_domain, "status_domain": status_domain,
+        "facnum_candidates": facnum_candidates,
+        "f_rpuid": f_rpuid, "f_catcode": f_catcode, "f_area": f_area, "f_length": f_length,
+        "f_area_u": f_area_u, "f_length_u": f_length_u, "length_choice_note": length_choice_note,
+    }
+
+    # Layer cursors honor selections, so one layer read only stands in for the dataset read
+    # when nothing is selected and the definition query applied to the dataset as well.
+    if f_owner_layer or f_status_layer:
+        try:
+            has_selection = bool(lyr.getSelectionSet())
+        except Exception:
+            has_selection = True
+        plan["single_cursor"] = not has_selection and where_for_dataset == (layer_def or None)
+
+    # A prior full scan (or one with the same filter) claims every OID this layer could
+    # contribute; its read is skipped unless that earlier layer fails.
+    prior_scans = datasets_scanned.setdefault(dataset_key, {})
+    plan["prior"] = prior_scans.get(None) or prior_scans.get(where_for_dataset)
+    if plan["prior"] is None:
+        prior_scans[where_for_dataset] = plan
+    return plan
+
+def read_layer(plan):
+    """Cursor reads for one planned layer (runs on a worker thread)."""
+    f_owner_layer, f_status_layer = plan["f_owner_layer"], plan["f_status_layer"]
+    layer_only = [n for n in [f_owner_layer, f_status_layer] if n]
+    fields_to_read = plan["fields_to_read"]
+
+    # Owner/status that exist only on the layer: when the layer cursor returns the same rows
+    # as the dataset read (no selection, definition query usable on the dataset), read
+    # everything through the layer in one cursor; the extra columns ride at the row tail.
+    owner_cache, status_cache = {}, {}
+    if layer_only and plan["single_cursor"]:
+        try:
+            i_owner_l = len(fields_to_read) if f_owner_layer else None
+            i_status_l = (len(fields_to_read) + (1 if f_owner_layer else 0)) if f_status_layer else None
+            rows = []
+            with arcpy.da.SearchCursor(plan["lyr"], fields_to_read + layer_only) as cursor:
+                for row in cursor:
+                    rows.append(row)
+                    if i_owner_l is not None:
+                        owner_cache[row[0]] = row[i_owner_l]
+                    if i_status_l is not None:
+                        status_cache[row[0]] = row[i_status_l]
+            return owner_cache, status_cache, rows
+        except Exception as e:
+            logging.debug(f"Single layer cursor failed for {plan['layer_name']}; using two reads: {e}")
+            owner_cache, status_cache = {}, {}
+
+    # Cache owner/status from the layer if they are only on the layer
+    if layer_only:
+        oid_layer = plan["oid_layer"]
+        layer_fields_to_read = [oid_layer] + layer_only
+        with arcpy.da.SearchCursor(plan["lyr"], layer_fields_to_read, plan["layer_def"]) as lc:
+            for lr in lc:
+                rd = dict(zip(layer_fields_to_read, lr))
+                oidv = rd.get(oid_layer)
+                if f_owner_layer:
+                    owner_cache[oidv] = rd.get(f_owner_layer, "")
+                if f_status_layer:
+                    status_cache[oidv] = rd.get(f_status_layer, "")
+
+    # Main dataset read
+    with arcpy.da.SearchCursor(plan["dataset_path"], fields_to_read, plan["where"]) as cursor:
+        rows = list(cursor)
+    return owner_cache, status_cache, rows
+
+def merge_layer(plan, owner_cache, status_cache, rows):
+    """Filter, de-duplicate and aggregate one layer's rows (main thread, map order)."""
+    layer_name   = plan["layer_name"]
+    dataset_path = plan["dataset_path"]
+    dataset_bits = dataset_ids.setdefault(plan["dataset_key"], len(dataset_ids)) << 64
+    f_owner, f_status = plan["f_owner"], plan["f_status"]
+    owner_domain, status_domain = plan["owner_domain"], plan["status_domain"]
+    length_choice_note = plan["length_choice_note"]
+
+    # Row positions resolved once per layer; absent fields map to None
+    field_index = {name: i for i, name in enumerate(plan["fields_to_read"])}
+    i_rpuid, i_catcode = field_index.get(plan["f_rpuid"]), field_index.get(plan["f_catcode"])
+    i_area, i_length   = field_index.get(plan["f_area"]), field_index.get(plan["f_length"])
+    i_owner, i_status  = field_index.get(f_owner), field_index.get(f_status)
+    i_area_u, i_len_u  = field_index.get(plan["f_area_u"]), field_index.get(plan["f_length_u"])
+    fac_index = [(fn, field_index[fn]) for fn in plan["facnum_candidates"]]
+
+    for row in rows:
+        oid_val = row[0]
+        rpuid  = row[i_rpuid] if i_rpuid is not None else None
+        cat    = row[i_catcode] if i_catcode is not None else None
+        area   = row[i_area] if i_area is not None else None
+        length = row[i_length] if i_length is not None else None
+
+        # Facility number coalesce
+        fac_raw_value = None
+        fac_src = None
+        for fn, i in fac_index:
+            v = row[i]
+            if v and v != "Null":  # falsy covers None and ""
+                fac_raw_value, fac_src = v, fn
+                break
+
+        key_norm, was_trimmed, stripped, original = norm_fac_value(fac_raw_value)
+        if was_trimmed:
+            audit_space_trim("Dataset", os.path.basename(dataset_path),
+                             f"layer={layer_name}; OID={oid_val}; field={fac_src}",
+                             original, stripped)
+
+        if not key_norm:
+            excluded_audit_rows.append((run_ts, layer_name, oid_val, str(fac_raw_value).strip(), rpuid, cat,
+                                        "", "", area, length,
+                                        "Empty or NULL facility number"))
             continue
 
-        dataset_key = make_dataset_key(dataset_path)
-        dataset_fields = arcpy.ListFields(dataset_path)
-        field_lookup = make_field_lookup(dataset_fields)
-        alias_lookup = build_alias_lookup(dataset_fields)
-        ws = arcpy.Describe(dataset_path).path
-
-        # Domain maps
-        dataset_domain_maps = build_domain_decoder(ws, dataset_fields)
-        layer_fields = desc_layer.fields if hasattr(desc_layer, "fields") else arcpy.ListFields(lyr)
-        layer_domain_maps = build_domain_decoder(ws, layer_fields)
-
-        # Dataset field matches
-        f_rpuid   = get_matching_field(dataset_fields, ["rpuid","RPUID"])
-        f_facnum  = get_matching_field(dataset_fields, ["facilityNumber"])
-        f_catcode = get_matching_field(dataset_fields, ["categoryCode"])
-        f_area    = get_matching_field(dataset_fields, ["areaSize"])
-        f_owner   = get_matching_field(dataset_fields, ["owner"])
-        f_status  = get_matching_field(dataset_fields, ["operationalStatus"])
-        f_area_u  = get_matching_field(dataset_fields, ["areaSizeUom"])
-
-        # Fallbacks on layer if missing on dataset
-        f_owner_layer  = None if f_owner else get_matching_field(layer_fields, ["owner"])
-        f_status_layer = None if f_status else get_matching_field(layer_fields, ["operationalStatus"])
-
-        # Length candidates
-        cand_len_primary   = get_matching_field(dataset_fields, ["lengthSize"])
-        cand_len_fallback  = get_matching_field(dataset_fields, ["measuredLength"])
-        primary_is_double  = is_double_field(field_lookup, cand_len_primary)
-        fallback_is_double = is_double_field(field_lookup, cand_len_fallback)
-        if primary_is_double and fallback_is_double:
-            f_length, length_choice_note = cand_len_primary, "selected 'lengthSize' (Double; both candidates Double)"
-        elif primary_is_double:
-            f_length, length_choice_note = cand_len_primary, "selected 'lengthSize' (Double)"
-        elif fallback_is_double:
-            f_length, length_choice_note = cand_len_fallback, "selected fallback 'measuredLength' (Double)"
-        else:
-            f_length, length_choice_note = (cand_len_primary if cand_len_primary else cand_len_fallback,
-                                            "no length field available" if not (cand_len_primary or cand_len_fallback)
-                                            else ("selected 'lengthSize' (non-Double)" if cand_len_primary and cand_len_primary.lower() == "lengthsize"
-                                                  else "selected fallback 'measuredLength' (non-Double)"))
-        if f_length and f_length.lower() == "measuredlength":
-            f_length_u = get_matching_field(dataset_fields, ["measuredLengthUom"]) or get_matching_field(dataset_fields, ["lengthSizeUom"])
-        else:
-            f_length_u = get_matching_field(dataset_fields, ["lengthSizeUom"]) or get_matching_field(dataset_fields, ["measuredLengthUom"])
-
-        # Facility number candidates (alias-aware)
-        f_facnum_alias = get_field_by_alias(dataset_fields, ["Facility Number","FacilityNumber","Fac Nbr"])
-        catcode_is_fac = bool(f_catcode and alias_lookup.get(f_catcode, "") == "facility number")
-        facnum_candidates = dedup_keep_order([f_facnum, f_facnum_alias, f_catcode if catcode_is_fac else None])
-
-        if not facnum_candidates:
-            excluded_audit_rows.append({
-                "RunId": run_ts, "LayerName": lyr.name, "OBJECTID": "",
-                "FacilityNumberRaw": "", "RPUID": "", "CategoryCode": "",
-                "OperationalStatus": "", "Owner": "", "AreaSizeRaw": "", "LengthSizeRaw": "",
-                "Reason": "No facility-number candidates found in dataset fields"
-            })
+        # Status decode
+        status_raw = row[i_status] if f_status else status_cache.get(oid_val, "")
+        status_val = decode_with_domain(status_domain, status_raw)
+
+        # Owner decode
+        owner_raw = row[i_owner] if f_owner else owner_cache.get(oid_val, "")
+        owner_val = decode_with_domain(owner_domain, owner_raw)
+
+        # De-dup across layers that reference same dataset
+        dup_key = dataset_bits | oid_val
+        first_layer = first_seen_layer.get(dup_key)
+        if first_layer is not None:
+            excluded_audit_rows.append((run_ts, layer_name, oid_val, stripped, rpuid, cat,
+                                        status_val, owner_val, area, length,
+                                        f"Duplicate feature in dataset; first_seen_layer='{first_layer}'."))
             continue
+        first_seen_layer[dup_key] = layer_name
 
-        # OIDs and re{BASE_CODE}le field list
-        oid_dataset = arcpy.Describe(dataset_path).OIDFieldName
-        oid_layer   = arcpy.Describe(lyr).OIDFieldName  # usually same
-        fields_to_read = [oid_dataset] + dedup_keep_order([
-            f_rpuid, f_catcode, f_area, f_length, f_owner, f_status, f_area_u, f_length_u
-        ] + facnum_candidates)
-
-        # Respect layer definition query if valid on dataset
-        layer_def = getattr(lyr, "definitionQuery", None)
-        where_for_dataset = layer_def
-        try:
-            with arcpy.da.SearchCursor(dataset_path, [oid_dataset], where_for_dataset):
-                pass
-        except Exception:
-            where_for_dataset = None
+        # CSV match
+        if key_norm not in csv_data:
+            excluded_audit_rows.append((run_ts, layer_name, oid_val, stripped, rpuid, cat,
+                                        status_val, owner_val, area, length,
+                                        f"Facility number not found in CSV '{fac_col_name}'"))
+            continue
 
-        # Cache owner/status from the layer if they are only on the layer
-        owner_cache, status_cache = {}, {}
-        if f_owner_layer or f_status_layer:
-            layer_fields_to_read = [oid_layer] + [n for n in [f_owner_layer, f_status_layer] if n]
-            with arcpy.da.SearchCursor(lyr, layer_fields_to_read, layer_def) as lc:
-                for lr in lc:
-                    rd = dict(zip(layer_fields_to_read, lr))
-                    oidv = rd.get(oid_layer)
-                    if f_owner_layer:
-                        owner_cache[oidv] = rd.get(f_owner_layer, "")
-                    if f_status_layer:
-                        status_cache[oidv] = rd.get(f_status_layer, "")
-
-        # Main dataset read
-        with arcpy.da.SearchCursor(dataset_path, fields_to_read, where_for_dataset) as cursor:
-            for row in cursor:
-                row_dict = dict(zip(fields_to_read, row))
-                oid_val = row_dict.get(oid_dataset)
-
-                # Facility number coalesce
-                fac_raw_value = None
-                fac_src = None
-                for fn in facnum_candidates:
-                    if fn in row_dict:
-                        v = row_dict[fn]
-                        if v not in (None, "", "Null"):
-                            fac_raw_value = v
-                            fac_src = fn
-                            break
-
-                key_norm, was_trimmed, stripped, original = norm_fac_value(fac_raw_value)
-                if was_trimmed:
-                    space_trim_rows.append({
-                        "Source": "Dataset",
-                        "Location": os.path.basename(dataset_path),
-                        "Context": f"layer={lyr.name}; OID={oid_val}; field={fac_src}",
-                        "OriginalValue": original,
-                        "TrimmedValue": stripped
-                    })
-
-                if not key_norm:
-                    excluded_audit_rows.append({
-                        "RunId": run_ts, "LayerName": lyr.name, "OBJECTID": oid_val,
-                        "FacilityNumberRaw": str(fac_raw_value).strip(),
-                        "RPUID": row_dict.get(f_rpuid, ""), "CategoryCode": row_dict.get(f_catcode, ""),
-                        "OperationalStatus": "", "Owner": "", "AreaSizeRaw": row_dict.get(f_area, ""),
-                        "LengthSizeRaw": row_dict.get(f_length, ""),
-                        "Reason": "Empty or NULL facility number"
-                    })
-                    continue
+        # Status exclude
+        if status_val == "abandoned":
+            excluded_audit_rows.append((run_ts, layer_name, oid_val, stripped, rpuid, cat,
+                                        status_val, owner_val, area, length,
+                                        "OperationalStatus equals 'Abandoned'"))
+            continue
 
-                # Status decode
-                if f_status:
-                    status_raw = row_dict.get(f_status, "")
-                    status_val = decode_with_domain(f_status, status_raw, dataset_domain_maps)
-                else:
-                    status_raw = status_cache.get(oid_val, "")
-                    status_val = decode_with_domain(f_status_layer, status_raw, layer_domain_maps)
-
-                # Owner decode
-                if f_owner:
-                    owner_raw = row_dict.get(f_owner, "")
-                    owner_val = decode_with_domain(f_owner, owner_raw, dataset_domain_maps)
-                else:
-                    owner_raw = owner_cache.get(oid_val, "")
-                    owner_val = decode_with_domain(f_owner_layer, owner_raw, layer_domain_maps)
-
-                # De-dup across layers that reference same dataset
-                dup_key = (make_dataset_key(dataset_path), oid_val)
-                if dup_key in processed_oids:
-                    excluded_audit_rows.append({
-                        "RunId": run_ts, "LayerName": lyr.name, "OBJECTID": oid_val,
-                        "FacilityNumberRaw": stripped,
-                        "RPUID": row_dict.get(f_rpuid, ""), "CategoryCode": row_dict.get(f_catcode, ""),
-                        "OperationalStatus": status_val, "Owner": owner_val,
-                        "AreaSizeRaw": row_dict.get(f_area, ""), "LengthSizeRaw": row_dict.get(f_length, ""),
-                        "Reason": f"Duplicate feature in dataset; first_seen_layer='{first_seen_layer[dup_key]}'."
-                    })
-                    continue
-                else:
-                    processed_oids.add(dup_key)
-                    first_seen_layer[dup_key] = lyr.name
-
-                # CSV match
-                if key_norm not in csv_data:
-                    excluded_audit_rows.append({
-                        "RunId": run_ts, "LayerName": lyr.name, "OBJECTID": oid_val,
-                        "FacilityNumberRaw": stripped,
-                        "RPUID": row_dict.get(f_rpuid, ""), "CategoryCode": row_dict.get(f_catcode, ""),
-                        "OperationalStatus": status_val, "Owner": owner_val,
-                        "AreaSizeRaw": row_dict.get(f_area, ""), "LengthSizeRaw": row_dict.get(f_length, ""),
-                        "Reason": f"Facility number not found in CSV '{fac_col_name}'"
-                    })
-                    continue
+        # Owner exclude
+        if owner_val in EXCLUDED_OWNERS:
+            excluded_audit_rows.append((run_ts, layer_name, oid_val, stripped, rpuid, cat,
+                                        status_val, owner_val, area, length,
+                                        f"Owner equals '{owner_val}' (excluded set)"))
+            continue
 
-                # Status exclude
-                if status_val == "abandoned":
-                    excluded_audit_rows.append({
-                        "RunId": run_ts, "LayerName": lyr.name, "OBJECTID": oid_val,
-                        "FacilityNumberRaw": stripped,
-                        "RPUID": row_dict.get(f_rpuid, ""), "CategoryCode": row_dict.get(f_catcode, ""),
-                        "OperationalStatus": status_val, "Owner": owner_val,
-                        "AreaSizeRaw": row_dict.get(f_area, ""), "LengthSizeRaw": row_dict.get(f_length, ""),
-                        "Reason": "OperationalStatus equals 'Abandoned'"
-                    })
-                    continue
+        # Aggregate with contribution tracking (values come straight from the
+        # dataset cursor, so a NULL here is a real NULL, not a join mask)
+        area_u = str(row[i_area_u]).strip() if i_area_u is not None else ""
+        len_u  = str(row[i_len_u]).strip() if i_len_u is not None else ""
+
+        agg = results.get(key_norm)
+        if agg is None:
+            agg = results[key_norm] = {
+                "total_area": 0.0, "total_length": 0.0, "layers": set(),
+                "rpuids": set(), "catcodes": set(), "area_uoms": set(), "length_uoms": set(),
+                "area_seen": 0, "length_seen": 0
+            }
+
+        # Numeric fields hand back int/float already; only text needs float() + try
+        if isinstance(area, (float, int)):
+            agg["total_area"] += area
+            agg["area_seen"] += 1
+        elif area not in (None, "", "Null"):
+            try:
+                agg["total_area"] += float(area)
+                agg["area_seen"] += 1
+            except Exception:
+                pass
+        if isinstance(length, (float, int)):
+            agg["total_length"] += length
+            agg["length_seen"] += 1
+        elif length not in (None, "", "Null"):
+            try:
+                agg["total_length"] += float(length)
+                agg["length_seen"] += 1
+            except Exception:
+                pass
 
-                # Owner exclude
-                if owner_val in EXCLUDED_OWNERS:
-                    excluded_audit_rows.append({
-                        "RunId": run_ts, "LayerName": lyr.name, "OBJECTID": oid_val,
-                        "FacilityNumberRaw": stripped,
-                        "RPUID": row_dict.get(f_rpuid, ""), "CategoryCode": row_dict.get(f_catcode, ""),
-                        "OperationalStatus": status_val, "Owner": owner_val,
-                        "AreaSizeRaw": row_dict.get(f_area, ""), "LengthSizeRaw": row_dict.get(f_length, ""),
-                        "Reason": f"Owner equals '{owner_val}' (excluded set)"
-                    })
-                    continue
+        agg["layers"].add(layer_name)
+        if rpuid:  agg["rpuids"].add(str(rpuid))
+        if cat:    agg["catcodes"].add(str(cat))
+        if area_u: agg["area_uoms"].add(area_u)
+        if len_u:  agg["length_uoms"].add(len_u)
 
-                # Recovery for masked nulls
-                if f_area and row_dict.get(f_area) is None:
-                    rec = fetch_cell_from_dataset(dataset_path, oid_dataset, oid_val, f_area)
-                    if rec is not None:
-                        row_dict[f_area] = rec
-                if f_length and row_dict.get(f_length) is None:
-                    rec = fetch_cell_from_dataset(dataset_path, oid_dataset, oid_val, f_length)
-                    if rec is not None:
-                        row_dict[f_length] = rec
-
-                # Aggregate with contribution tracking
-                area   = row_dict.get(f_area)
-                length = row_dict.get(f_length)
-                rpuid  = row_dict.get(f_rpuid)
-                cat    = row_dict.get(f_catcode)
-                area_u = str(row_dict.get(f_area_u, "")).strip() if f_area_u else ""
-                len_u  = str(row_dict.get(f_length_u, "")).strip() if f_length_u else ""
-
-                if key_norm not in results:
-                    results[key_norm] = {
-                        "total_area": 0.0, "total_length": 0.0, "layers": set(),
-                        "rpuids": set(), "catcodes": set(), "area_uoms": set(), "length_uoms": set(),
-                        "area_seen": 0, "length_seen": 0
-                    }
-
-                if area not in (None, "", "Null"):
-                    try:
-                        results[key_norm]["total_area"] += float(area)
-                        results[key_norm]["area_seen"] += 1
-                    except Exception:
-                        pass
-                if length not in (None, "", "Null"):
-                    try:
-                        results[key_norm]["total_length"] += float(length)
-                        results[key_norm]["length_seen"] += 1
-                    except Exception:
-                        pass
-
-                results[key_norm]["layers"].add(lyr.name)
-                if rpuid:  results[key_norm]["rpuids"].add(str(rpuid))
-                if cat:    results[key_norm]["catcodes"].add(str(cat))
-                if area_u: results[key_norm]["area_uoms"].add(area_u)
-                if len_u:  results[key_norm]["length_uoms"].add(len_u)
-
-                included_audit_rows.append({
-                    "RunId": run_ts, "LayerName": lyr.name, "OBJECTID": oid_val,
-                    "FacilityNumber": stripped, "RPUID": rpuid, "CategoryCode": cat,
-                    "AreaSize": area, "LengthSize": length,
-                    "AreaSizeUOM": area_u, "LengthUOM": len_u,
-                    "Reason": f"Matched CSV '{fac_col_name}'; {length_choice_note}; facilityNumber_source={fac_src}"
-                })
-
-        logging.info(f"Processed layer: {lyr.name}")
+        included_audit_rows.append((run_ts, layer_name, oid_val, stripped, rpuid, cat,
+                                    area, length, area_u, len_u,
+                                    f"Matched CSV '{fac_col_name}'; {length_choice_note}; facilityNumber_source={fac_src}"))
 
+layer_plans = []
+for lyr in iter_feature_layers(active_map):
+    try:
+        plan = plan_layer(lyr)
     except Exception as e:
         logging.error(f"Error processing layer {lyr.name}: {e}")
+        continue
+    if plan is not None:
+        layer_plans.append(plan)
+
+# At most `workers` reads are in flight (or finished but unmerged) ahead of the merge, so
+# memory holds a few layers' rows rather than every row in the map
+workers = max(1, min(MAX_WORKERS, len(layer_plans)))
+read_queue = deque(i for i, plan in enumerate(layer_plans) if not plan["prior"])
+in_flight = {}  # plan index -> future
+with ThreadPoolExecutor(max_workers=workers) as ex:
+    for i, plan in enumerate(layer_plans):
+        while read_queue and len(in_flight) < workers:
+            j = read_queue.popleft()
+            in_flight[j] = ex.submit(read_layer, layer_plans[j])
+        fut = in_flight.pop(i, None)
+        layer_name = plan["layer_name"]
+        try:
+            if fut is None:
+                prior = plan["prior"]
+                if not prior["failed"]:
+                    excluded_audit_rows.append(layer_exclusion(
+                        layer_name, f"Duplicate dataset reference; features already processed via layer '{prior['layer_name']}'"))
+                    logging.info(f"Skipped layer (dataset already scanned): {layer_name}")
+                    continue
+                data = read_layer(plan)  # the claiming layer failed, so read this one after all
+            else:
+                data = fut.result()
+            merge_layer(plan, *data)
+            logging.info(f"Processed layer: {layer_name}")
+        except Exception as e:
+            plan["failed"] = True
+            logging.error(f"Error processing layer {layer_name}: {e}")
 
 # ===================== WRITE OUTPUTS =====================
 
-# Appended CSV mirrors original columns and adds totals and provenance columns
-with open(INPUT_CSV, 'r', encoding='utf-8-sig', newline='') as src, \
-     open(output_csv, 'w', encoding='utf-8-sig', newline='') as out_csv:
-
-    reader = csv.DictReader(src)
-    base_fields = list(reader.fieldnames or [])
-    writer = csv.DictWriter(out_csv, fieldnames=base_fields + [
-        "TotalArea", "TotalLength", "SourceLayers", "RPUIDs", "CategoryCodes", "AreaUOMs", "LengthUOMs"
-    ])
-    writer.writeheader()
+# Finalize each facility once: totals and provenance strings are per key, not per CSV row
+for agg in results.values():
+    agg["total_area_str"]   = "" if agg["area_seen"] == 0 else f"{agg['total_area']:.2f}"
+    agg["total_length_str"] = "" if agg["length_seen"] == 0 else f"{agg['total_length']:.2f}"
+    agg["layers_str"]       = "; ".join(sorted(agg["layers"]))
+    agg["rpuids_str"]       = "; ".join(sorted(agg["rpuids"]))
+    agg["catcodes_str"]     = "; ".join(sorted(agg["catcodes"]))
+    agg["area_uoms_str"]    = "; ".join(sorted(agg["area_uoms"]))
+    agg["length_uoms_str"]  = "; ".join(sorted(agg["length_uoms"]))
 
-    for row in reader:
-        key_norm, _, _, _ = norm_fac_value(row.get(fac_col_name, ""))
-
-        if key_norm in results:
-            agg = results[key_norm]
-            total_area   = "" if agg.get("area_seen", 0)   == 0 else f"{agg.get('total_area', 0.0):.2f}"
-            total_length = "" if agg.get("length_seen", 0) == 0 else f"{agg.get('total_length', 0.0):.2f}"
-
-            writer.writerow({
-                **row,
-                "TotalArea": total_area,
-                "TotalLength": total_length,
-                "SourceLayers": "; ".join(sorted(agg.get("layers", []))),
-                "RPUIDs": "; ".join(sorted(agg.get("rpuids", []))),
-                "CategoryCodes": "; ".join(sorted(agg.get("catcodes", []))),
-                "AreaUOMs": "; ".join(sorted(agg.get("area_uoms", []))),
-                "LengthUOMs": "; ".join(sorted(agg.get("length_uoms", [])))
-            })
+# Appended CSV mirrors original columns and adds totals and provenance columns
+APPENDED_COLS = ["TotalArea", "TotalLength", "SourceLayers", "RPUIDs", "CategoryCodes", "AreaUOMs", "LengthUOMs"]
+with open(output_csv, 'w', encoding='utf-8-sig', newline='', buffering=CSV_BUFFER) as out_csv:
+    writer = csv.writer(out_csv)
+    writer.writerow(header + APPENDED_COLS)
+
+    for key_norm, row in csv_rows:
+        agg = results.get(key_norm)
+        if agg is not None:
+            writer.writerow(row + [
+                agg["total_area_str"], agg["total_length_str"], agg["layers_str"], agg["rpuids_str"],
+                agg["catcodes_str"], agg["area_uoms_str"], agg["length_uoms_str"]
+            ])
         else:
             # No GIS match → keep every original CSV column intact and leave appended fields BLANK
-            writer.writerow({
-                **row,
-                "TotalArea": "",
-                "TotalLength": "",
-                "SourceLayers": "",
-                "RPUIDs": "",
-                "CategoryCodes": "",
-                "AreaUOMs": "",
-                "LengthUOMs": ""
-            })
+            writer.writerow(row + [""] * len(APPENDED_COLS))
 
 # Included features audit
-included_audit_rows.sort(key=lambda r: (r["LayerName"], r["OBJECTID"]))
-with open(included_audit_csv, 'w', encoding='utf-8-sig', newline='') as inc_csv:
-    fieldnames = ["RunId", "LayerName", "OBJECTID", "FacilityNumber", "RPUID",
-                  "CategoryCode", "AreaSize", "LengthSize", "AreaSizeUOM",
-                  "LengthUOM", "Reason"]
-    writer = csv.DictWriter(inc_csv, fieldnames=fieldnames)
-    writer.writeheader()
+included_audit_rows.sort(key=audit_sort_key)
+with open(included_audit_csv, 'w', encoding='utf-8-sig', newline='', buffering=CSV_BUFFER) as inc_csv:
+    writer = csv.writer(inc_csv)
+    writer.writerow(INC_COLS)
     writer.writerows(included_audit_rows)
 
 # Excluded features audit
-excluded_audit_rows.sort(key=lambda r: (r["LayerName"], r["OBJECTID"]))
-with open(excluded_audit_csv, 'w', encoding='utf-8-sig', newline='') as exc_csv:
-    fieldnames = ["RunId", "LayerName", "OBJECTID", "FacilityNumberRaw", "RPUID",
-                  "CategoryCode", "OperationalStatus", "Owner", "AreaSizeRaw",
-                  "LengthSizeRaw", "Reason"]
-    writer = csv.DictWriter(exc_csv, fieldnames=fieldnames)
-    writer.writeheader()
+excluded_audit_rows.sort(key=audit_sort_key)
+with open(excluded_audit_csv, 'w', encoding='utf-8-sig', newline='', buffering=CSV_BUFFER) as exc_csv:
+    writer = csv.writer(exc_csv)
+    writer.writerow(EXC_COLS)
     writer.writerows(excluded_audit_rows)
 
-# Space-trim audit (CSV + Dataset sides)
-with open(space_trim_audit_csv, 'w', encoding='utf-8-sig', newline='') as spa_csv:
-    fieldnames = ["Source", "Location", "Context", "OriginalValue", "TrimmedValue"]
-    writer = csv.DictWriter(spa_csv, fieldnames=fieldnames)
-    writer.writeheader()
-    writer.writerows(space_trim_rows)
+# Space-trim audit (CSV + Dataset sides) was streamed during the run
+if space_trim_fh is not None:
+    space_trim_fh.close()
+space_trim_note = space_trim_audit_csv if space_trim_count else "none (no whitespace trims found)"
 
 # ==== LOG COMPLETION ====
 logging.info(f"Appended CSV: {output_csv}")
 logging.info(f"Included Features Audit: {included_audit_csv} ({len(included_audit_rows)} rows)")
 logging.info(f"Excluded Features Audit: {excluded_audit_csv} ({len(excluded_audit_rows)} rows)")
-logging.info(f"Space Trim Audit: {space_trim_audit_csv} ({len(space_trim_rows)} rows)")
+logging.info(f"Space Trim Audit: {space_trim_note} ({space_trim_count} rows)")
 logging.info("=== Script complete ===")
 
 arcpy.AddMessage(f"Output CSV: {output_csv}")
 arcpy.AddMessage(f"Included Features Audit: {included_audit_csv}")
 arcpy.AddMessage(f"Excluded Features Audit: {excluded_audit_csv}")
-arcpy.AddMessage(f"Space Trim Audit: {space_trim_audit_csv}")
+arcpy.AddMessage(f"Space Trim Audit: {space_trim_note}")
 arcpy.AddMessage(f"Log: {log_filename}")
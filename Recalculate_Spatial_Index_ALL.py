@@ -25,13 +25,19 @@ Outputs (written to project home or next to the default GDB):
 ================================================================================
 """
 
-import arcpy, os, sys, csv, logging, time
-from collections import OrderedDict, deque
+import arcpy, os, sys, csv, logging, threading, time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # ---------------- Configuration (adjust only if needed) ----------------------
 RECALC_EXTENT  = True   # also recalc FC extent header with RecalculateFeatureClassExtent
 REMOVE_FIRST   = True   # try RemoveSpatialIndex before AddSpatialIndex when possible
+CSV_BUFFER     = 1 << 20  # 1 MB write buffer for the QA/QC CSVs
+# Workspaces rebuilt concurrently; 1 = sequential on the main thread. The rebuild runs GP
+# tools (TestSchemaLock, Add/RemoveSpatialIndex, RecalculateFeatureClassExtent) and arcpy
+# geoprocessing is not thread-safe, so values above 1 are opt-in and unsupported.
+MAX_WORKERS    = 1
 
 # ---------------- Resolve project paths (cross-user) -------------------------
 _aprx = arcpy.mp.ArcGISProject("CURRENT")
@@ -59,18 +65,29 @@ def _warn(s): arcpy.AddWarning(s); log.warning(s)
 def _err(s): arcpy.AddError(s); log.error(s)
 
 # ---------------- Helpers ----------------
+_DESCRIBE_CACHE = {}  # path -> Describe object, or None when Describe failed
+
 def describe_safe(path):
+    """Describe each path once per run; also files the result under its catalogPath."""
+    if path in _DESCRIBE_CACHE:
+        return _DESCRIBE_CACHE[path]
     try:
-        return arcpy.Describe(path)
+        d = arcpy.Describe(path)
     except Exception:
-        return None
+        d = None
+    _DESCRIBE_CACHE[path] = d
+    cat = getattr(d, "catalogPath", None) if d else None
+    if cat:
+        _DESCRIBE_CACHE.setdefault(cat, d)
+    return d
 
 def is_concrete_fc(path):
     """
     Accept local or enterprise feature classes and shapefiles with geometry.
     Reject services, query layers, joins, tables, and annotation/dimension.
+    A path that does not exist fails Describe, so no separate Exists check.
     """
-    if not path or not arcpy.Exists(path):
+    if not path:
         return False
     d = describe_safe(path)
     if not d:
@@ -133,17 +150,27 @@ def infer_workspace(path):
     return os.path.dirname(path)
 
 def walk_workspace_collect_fc(workspace):
-    """Collect concrete feature classes by walking a workspace."""
-    collected = OrderedDict()
+    """
+    Collect concrete feature classes in a workspace (root and feature datasets).
+    ListFeatureClasses filters by shape type; keys are normalized to catalogPath
+    through describe_safe (rebuild_fc reuses that cached Describe).
+    Changes arcpy.env.workspace while listing, so only call it while no
+    rebuild_all workers are running.
+    """
+    collected = {}
+    saved_ws = arcpy.env.workspace
     try:
-        for dirpath, dirnames, filenames in arcpy.da.Walk(workspace, datatype="FeatureClass"):
-            for name in filenames:
-                fc = os.path.join(dirpath, name)
-                if is_concrete_fc(fc):
-                    cat = describe_safe(fc).catalogPath
-                    collected[cat] = True
+        arcpy.env.workspace = workspace
+        for ds in [""] + (arcpy.ListDatasets("", "Feature") or []):
+            for shape in ("Point", "Polyline", "Polygon", "Multipoint"):
+                for name in arcpy.ListFeatureClasses("", shape, ds) or []:
+                    fc = os.path.join(workspace, ds, name)
+                    d = describe_safe(fc)
+                    collected[getattr(d, "catalogPath", None) or fc] = True
     except Exception as ex:
         log.info(f"Workspace walk skipped for {workspace}: {ex}")
+    finally:
+        arcpy.env.workspace = saved_ws
     return collected
 
 def rebuild_fc(fc_path):
@@ -157,7 +184,7 @@ def rebuild_fc(fc_path):
     ds_name = getattr(d, "name", os.path.basename(fc_path)) if d else os.path.basename(fc_path)
     ws = getattr(d, "path", os.path.dirname(fc_path)) if d else os.path.dirname(fc_path)
     shp = getattr(d, "shapeType", None) if d else None
-    before_idx = has_spatial_index(fc_path)
+    before_idx = has_spatial_index(fc_path)  # pre-rebuild state (Describe is cached)
 
     row = {
         "dataset": ds_name,
@@ -209,6 +236,29 @@ def rebuild_fc(fc_path):
         log.error(f"  ERROR: {ex}")
         return "Skipped", row
 
+def rebuild_all(fc_paths, emit):
+    """
+    Rebuild many feature classes, feature classes inside a workspace in order.
+    With MAX_WORKERS = 1 everything runs on the calling thread; above that (unsupported)
+    each workspace gets one worker, never two jobs against the same .gdb/.sde at once.
+    emit(status, row) is called as soon as each rebuild_fc returns, so it must be thread-safe.
+    """
+    by_ws = {}
+    for fc in fc_paths:
+        by_ws.setdefault(infer_workspace(fc) or "", []).append(fc)
+
+    def _run_workspace(fcs):
+        for fc in fcs:
+            emit(*rebuild_fc(fc))
+
+    workers = max(1, min(MAX_WORKERS, len(by_ws)))
+    if workers == 1:
+        for fcs in by_ws.values():
+            _run_workspace(fcs)
+        return
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        list(ex.map(_run_workspace, by_ws.values()))  # re-raises any worker error
+
 # ---------------- Main ----------------
 def run():
     maps = _aprx.listMaps()
@@ -219,7 +269,7 @@ def run():
     _msg("Maps detected: " + ", ".join(m.name for m in maps))
 
     # Collect all concrete FCs referenced by maps (deep)
-    seen_fc = OrderedDict()
+    seen_fc = {}
     skips_layers = []
 
     for m in maps:
@@ -235,12 +285,12 @@ def run():
                 cat = describe_safe(ds).catalogPath
                 seen_fc[cat] = True
             else:
-                if not arcpy.Exists(ds):
+                d = describe_safe(ds)  # cached from is_concrete_fc
+                if d is None:
                     skips_layers.append((name, "Path does not exist", ds))
                 else:
-                    d = describe_safe(ds)
-                    dt = getattr(d, "dataType", None) if d else None
-                    st = getattr(d, "shapeType", None) if d else None
+                    dt = getattr(d, "dataType", None)
+                    st = getattr(d, "shapeType", None)
                     reason = "Not a concrete, writable feature class"
                     if st is None:
                         reason = f"{dt} exposes no shapeType (likely service/query/join)"
@@ -248,64 +298,65 @@ def run():
 
     _msg(f"Eligible feature classes via deep traversal: {len(seen_fc)}")
 
-    processed_rows, skipped_rows = [], []
-    processed = 0
-
-    # Process found FCs
-    for fc in seen_fc.keys():
-        status, row = rebuild_fc(fc)
-        (processed_rows if status == "Processed" else skipped_rows).append(row)
-        if status == "Processed":
-            processed += 1
-
-    # Fallback discovery if nothing processed
-    if processed == 0:
-        workspaces = OrderedDict()
-        for _, _, detail in skips_layers:
-            ws = infer_workspace(detail) if isinstance(detail, str) else None
-            if ws and arcpy.Exists(ws):
-                workspaces[ws] = True
-
-        # Always include default GDB for good measure
-        if _aprx.defaultGeodatabase and arcpy.Exists(_aprx.defaultGeodatabase):
-            workspaces[_aprx.defaultGeodatabase] = True
-
-        if workspaces:
-            _msg("Fallback workspaces: " + ", ".join(workspaces.keys()))
-            walked = OrderedDict()
-            for ws in workspaces.keys():
-                walked.update(walk_workspace_collect_fc(ws))
-            _msg(f"Feature classes discovered via workspace walk: {len(walked)}")
-            for fc in walked.keys():
-                status, row = rebuild_fc(fc)
-                (processed_rows if status == "Processed" else skipped_rows).append(row)
-                if status == "Processed":
-                    processed += 1
-        else:
-            _msg("No valid local workspaces inferred for fallback.")
-
     # ---------------- Write CSVs ----------------
     proc_fields = ["dataset","catalogPath","workspace","shapeType",
                    "hadSpatialIndex","removedFirst","addedIndex","recalcExtent","result","note"]
     skip_fields = ["layerName","reason","detail"]
 
-    with open(CSV_PROC, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=proc_fields)
-        w.writeheader()
-        for r in processed_rows + skipped_rows:  # include both with result flags
-            # Only rows from rebuild_fc have these keys
-            if "dataset" in r:
-                w.writerow(r)
-
-    with open(CSV_SKIP, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=skip_fields)
-        w.writeheader()
-        for n, reason, detail in skips_layers:
-            w.writerow({"layerName": n, "reason": reason, "detail": detail})
+    # Discovery is complete, so the skip CSV can be written before any rebuild starts
+    with open(CSV_SKIP, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER) as f:
+        w = csv.writer(f)
+        w.writerow(skip_fields)
+        w.writerows(skips_layers)  # (layerName, reason, detail) tuples already in column order
+
+    # Rebuild rows are streamed and flushed per FC so a crash mid-run keeps what finished
+    processed = skipped = 0
+    with open(CSV_PROC, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER) as proc_fh:
+        proc_writer = csv.DictWriter(proc_fh, fieldnames=proc_fields)
+        proc_writer.writeheader()
+
+        lock = threading.Lock()
+
+        def emit(status, row):
+            nonlocal processed, skipped
+            with lock:
+                proc_writer.writerow(row)
+                proc_fh.flush()
+                if status == "Processed":
+                    processed += 1
+                else:
+                    skipped += 1
+
+        # Process found FCs
+        rebuild_all(list(seen_fc.keys()), emit)
+
+        # Fallback discovery if nothing processed
+        if processed == 0:
+            workspaces = {}
+            for _, _, detail in skips_layers:
+                ws = infer_workspace(detail) if isinstance(detail, str) else None
+                if ws and arcpy.Exists(ws):
+                    workspaces[ws] = True
+
+            # Always include default GDB for good measure
+            if _aprx.defaultGeodatabase and arcpy.Exists(_aprx.defaultGeodatabase):
+                workspaces[_aprx.defaultGeodatabase] = True
+
+            if workspaces:
+                # The first rebuild_all has returned, so no worker is running while the walk
+                # switches arcpy.env.workspace
+                _msg("Fallback workspaces: " + ", ".join(workspaces.keys()))
+                walked = {}
+                for ws in workspaces.keys():
+                    walked.update(walk_workspace_collect_fc(ws))
+                _msg(f"Feature classes discovered via workspace walk: {len(walked)}")
+                rebuild_all(list(walked.keys()), emit)
+            else:
+                _msg("No valid local workspaces inferred for fallback.")
 
     # ---------------- Summary ----------------
-    _msg(f"Processed feature classes: {sum(1 for r in processed_rows if r.get('result')=='Processed')}")
-    _msg(f"Skipped during rebuild (from processing phase): {sum(1 for r in skipped_rows if r.get('result')=='Skipped')}")
+    _msg(f"Processed feature classes: {processed}")
+    _msg(f"Skipped during rebuild (from processing phase): {skipped}")
     if skips_layers:
         _msg(f"Skipped layers during discovery: {len(skips_layers)}")
 
@@ -48,6 +48,7 @@ import os
 import csv
 import datetime
 import traceback
+from collections import deque
 from contextlib import contextmanager
 
 # -------------------------- Configuration --------------------------
@@ -85,52 +86,52 @@ def _add_warn(msg): arcpy.AddWarning(msg)
 def _add_err(msg):  arcpy.AddError(msg)
 
 def _find_group(map_obj, name_ci):
+    # Pre-order walk of group layers (children pushed reversed to keep TOC order)
     key = (name_ci or "").strip().lower()
-    for lyr in map_obj.listLayers():
-        found = _find_group_recursive(lyr, key)
-        if found:
-            return found
+    stack = deque(reversed(map_obj.listLayers()))
+    while stack:
+        lyr = stack.pop()
+        if getattr(lyr, "isGroupLayer", False):
+            if (lyr.name or "").strip().lower() == key:
+                return lyr
+            stack.extend(reversed(lyr.listLayers()))
     raise RuntimeError(f"Group '{GROUP_NAME}' not found in active map.")
 
-def _find_group_recursive(layer, key_lower):
-    if getattr(layer, "isGroupLayer", False):
-        if (layer.name or "").strip().lower() == key_lower:
-            return layer
-        for child in layer.listLayers():
-            found = _find_group_recursive(child, key_lower)
-            if found:
-                return found
-    return None
-
 def _iter_feature_layers(group_layer):
-    # Depth-first feature layer enumeration under a group
-    for child in group_layer.listLayers():
+    # Depth-first feature layer enumeration under a group, in TOC order
+    stack = deque(reversed(group_layer.listLayers()))
+    while stack:
+        child = stack.pop()
         if getattr(child, "isGroupLayer", False):
-            for sub in _iter_feature_layers(child):
-                yield sub
-        else:
-            try:
-                subs = child.listLayers()
-                if subs:
-                    for sub in subs:
-                        for x in _iter_feature_layers(sub):
-                            yield x
-                    continue
-            except Exception:
-                pass
-            if getattr(child, "isFeatureLayer", False):
-                yield child
+            stack.extend(reversed(child.listLayers()))
+            continue
+        try:
+            subs = child.listLayers()
+            if subs:
+                stack.extend(reversed(subs))
+                continue
+        except Exception:
+            pass
+        if getattr(child, "isFeatureLayer", False):
+            yield child
 
-def _catalog_path(layer_or_path):
+def _describe_layer(lyr):
+    """Return (catalog_path, shape_type_lower, has_z) from a single Describe of the layer."""
     try:
-        if hasattr(layer_or_path, "dataSource") and layer_or_path.dataSource:
-            return layer_or_path.dataSource
+        d = arcpy.Describe(lyr)
     except Exception:
-        pass
+        d = None
+    cat = None
     try:
-        return arcpy.Describe(layer_or_path).catalogPath
+        if hasattr(lyr, "dataSource") and lyr.dataSource:
+            cat = lyr.dataSource
     except Exception:
-        return None
+        pass
+    if not cat and d is not None:
+        cat = getattr(d, "catalogPath", None)
+    if d is None:
+        return cat, "", False
+    return cat, (getattr(d, "shapeType", "") or "").lower(), bool(getattr(d, "hasZ", False))
 
 def _basename_no_ext(path_or_name):
     if not path_or_name:
@@ -141,28 +142,12 @@ def _basename_no_ext(path_or_name):
         name = name.split(".")[-1]
     return name
 
-def _shape_type(ds):
-    try:
-        return (arcpy.Describe(ds).shapeType or "").lower()
-    except Exception:
-        return ""
-
-def _has_z(ds):
-    try:
-        return bool(getattr(arcpy.Describe(ds), "hasZ", False))
-    except Exception:
-        return False
-
 def _dataset_has_curves(ds):
     try:
         return bool(getattr(arcpy.Describe(ds), "hasCurves", False))
     except Exception:
         return False
 
-def _make_feature_layer_from_layer(layer_obj, name, where=None):
-    # Wrap the existing map layer so we carry selection and definition query forward
-    return arcpy.management.MakeFeatureLayer(layer_obj, name, where).getOutput(0)
-
 def _collect_rasters_recursive(layer, bag):
     try:
         d = arcpy.Describe(layer)
@@ -185,12 +170,12 @@ def _resolve_raster_in_group(group_layer, display_name):
     rasters = []
     for top in group_layer.listLayers():
         _collect_rasters_recursive(top, rasters)
+    by_name = {}
     for r in rasters:
-        nm = (r.name or "").strip()
-        if nm.lower() == key:
-            return r
-    for r in rasters:
-        nm = (r.name or "").strip().lower()
+        by_name.setdefault((r.name or "").strip().lower(), r)  # first in TOC order wins
+    if key in by_name:
+        return by_name[key]
+    for nm, r in by_name.items():
         if nm.startswith(key):
             return r
     raise RuntimeError(f"Required raster '{display_name}' not found in group '{GROUP_NAME}'.")
@@ -205,9 +190,11 @@ def _scoped_env(geo_transform):
     finally:
         arcpy.env.geographicTransformations = saved_gt
 
+_SUFFIXES = frozenset(("_p", "_a", "_l"))
+
 def _suffix_supported(layer_name):
     nm = (layer_name or "").strip().lower()
-    return nm.endswith(("_p", "_a", "_l"))
+    return nm[-2:] in _SUFFIXES
 
 # -------------------------- Main ------------------------------
 def run():
@@ -256,14 +243,12 @@ def run():
             _wlog("[INFO] Geographic Transformation: <default/none>")
 
         for lyr in _iter_feature_layers(group):
-            cat = _catalog_path(lyr)
+            cat, geom, hasz = _describe_layer(lyr)
             if not cat or not arcpy.Exists(cat):
                 _wlog(f"[WARN] Skipping (no catalog): {lyr.name}")
                 continue
 
             base = _basename_no_ext(cat)
-            geom = _shape_type(lyr)
-            hasz = _has_z(lyr)
             ds_has_curves = _dataset_has_curves(cat)
 
             layers_csv.writerow({
@@ -365,7 +350,8 @@ def _apply_update(src_layer, raster, geom_type, updates_csv, log):
     Curve-safe: skips any feature with true curves.
     Audits XY identity by comparing part and vertex counts before and after.
     """
-    lyr = _make_feature_layer_from_layer(src_layer, f"u_{_now_stamp()}")
+    # GP tools honour the map layer's own selection and definition query, so no copy is needed
+    lyr = src_layer
 
     try:
         attempted = int(arcpy.management.GetCount(lyr).getOutput(0))
@@ -388,7 +374,6 @@ def _apply_update(src_layer, raster, geom_type, updates_csv, log):
             "audit_vertex_count_before": "", "audit_vertex_count_after": ""
         })
         log(f"[INFO] {layer_name}: selection empty; raster={raster_name}")
-        arcpy.management.Delete(lyr)
         return
 
     # Per-feature curve guard for non-point types
@@ -413,7 +398,6 @@ def _apply_update(src_layer, raster, geom_type, updates_csv, log):
                 "audit_vertex_count_before": "", "audit_vertex_count_after": ""
             })
             log(f"[INFO] {layer_name}: selection contains true curves; skipped to preserve geometry")
-            arcpy.management.Delete(lyr)
             return
 
     # Pre-audit counts for XY identity check (non-points)
@@ -451,7 +435,6 @@ def _apply_update(src_layer, raster, geom_type, updates_csv, log):
                     "audit_vertex_count_after": verts_after
                 })
                 log(f"[ERR] {layer_name}: {msg}; raster={raster_name}")
-                arcpy.management.Delete(lyr)
                 return
 
         updates_csv.writerow({
@@ -478,8 +461,6 @@ def _apply_update(src_layer, raster, geom_type, updates_csv, log):
             "audit_vertex_count_after": ""
         })
         log(f"[ERR] {layer_name}: {e}")
-    finally:
-        arcpy.management.Delete(lyr)
 
 if __name__ == "__main__":
     run()